@@ -1,7 +1,12 @@
 """Main Reflex application with YAML editor using reflex-monaco."""
 
+import asyncio
+import contextlib
+import logging
+
 import reflex as rx
 
+from .chat_agent import SessionDeps, chat_agent
 from .components import chat_sidebar
 from .tabs import (
     code_tab_content,
@@ -12,20 +17,10 @@ from .tabs import (
 
 SIDEBAR_WIDTH_PERCENT = "33.333%"
 MAIN_CONTENT_WIDTH_PERCENT = "66.667%"
+STREAM_FLUSH_INTERVAL_SECONDS = 0.1
+CHAT_HISTORY_PAGE_SIZE = 50
 
-
-class ConnectorBuilderState(rx.State):
-    """State management for the YAML editor and tabs."""
-
-    current_tab: str = "requirements"
-
-    source_api_name: str = ""
-    connector_name: str = ""
-    documentation_urls: str = ""
-    functional_requirements: str = ""
-    test_list: str = ""
-
-    yaml_content: str = """# Example YAML configuration
+DEFAULT_YAML_CONTENT = """# Example YAML configuration
 name: example-connector
 version: "1.0.0"
 description: "A sample connector configuration"
@@ -48,61 +43,108 @@ transformations:
       email: email_address
 """
 
-    chat_messages: list[dict[str, str]] = []
+
+class ConnectorBuilderState(rx.State):
+    """State management for the YAML editor and tabs."""
+
+    current_tab: str = "requirements"
+
+    source_api_name: str = ""
+    connector_name: str = ""
+    documentation_urls: str = ""
+    functional_requirements: str = ""
+    test_list: str = ""
+
+    yaml_content: str = DEFAULT_YAML_CONTENT
+
+    # Chat history stored as parallel lists: chat_roles[i] is the role
+    # ("user" or "assistant") of the message whose text is chat_contents[i].
+    chat_roles: list[str] = []
+    chat_contents: list[str] = []
+    chat_history_limit: int = CHAT_HISTORY_PAGE_SIZE
     chat_input: str = ""
     current_streaming_message: str = ""
     chat_loading: bool = False
 
-    def get_content_length(self) -> int:
-        """Get the content length."""
+    @rx.var
+    def fields_disabled(self) -> bool:
+        """Whether the requirements fields are locked until a source API is named."""
+        return not self.source_api_name.strip()
+
+    @rx.var
+    def visible_chat_roles(self) -> list[str]:
+        """Get the roles of the chat messages that fit in the history window."""
+        return self.chat_roles[-self.chat_history_limit :]
+
+    @rx.var
+    def visible_chat_contents(self) -> list[str]:
+        """Get the text of the chat messages that fit in the history window."""
+        return self.chat_contents[-self.chat_history_limit :]
+
+    @rx.var
+    def hidden_chat_message_count(self) -> int:
+        """Get the number of older chat messages outside the history window."""
+        return max(len(self.chat_contents) - self.chat_history_limit, 0)
+
+    @rx.var
+    def yaml_content_length(self) -> int:
+        """Get the number of characters in the YAML content."""
         return len(self.yaml_content)
 
+    def _set_requirement(self, field: str, value: str):
+        """Set a requirements field only if its value actually changed.
+
+        Reflex marks a var dirty on every assignment, which recomputes
+        dependent vars and sends a delta even when the string is identical.
+        The fields are flat strings, so a plain equality check suffices.
+        """
+        if getattr(self, field) != value:
+            setattr(self, field, value)
+
+    def commit_source_api_name(self, value: str):
+        """Store the source API name from the debounced input."""
+        self._set_requirement("source_api_name", value)
+
+    def commit_connector_name(self, value: str):
+        """Store the connector name from the debounced input."""
+        self._set_requirement("connector_name", value)
+
+    def commit_documentation_urls(self, value: str):
+        """Store the documentation URLs committed from the text area."""
+        self._set_requirement("documentation_urls", value)
+
+    def commit_functional_requirements(self, value: str):
+        """Store the functional requirements committed from the text area."""
+        self._set_requirement("functional_requirements", value)
+
+    def commit_test_list(self, value: str):
+        """Store the test list committed from the text area."""
+        self._set_requirement("test_list", value)
+
+    def _append_chat_message(self, role: str, content: str):
+        """Append a message to the chat history."""
+        self.chat_roles.append(role)
+        self.chat_contents.append(content)
+
+    def show_earlier_messages(self):
+        """Extend the chat history window by one page of older messages."""
+        self.chat_history_limit += CHAT_HISTORY_PAGE_SIZE
+
     def update_yaml_content(self, content: str):
         """Update the YAML content when editor changes."""
         self.yaml_content = content
 
     def reset_yaml_content(self):
         """Reset YAML content to default example."""
-        self.yaml_content = """# Example YAML configuration
-name: example-connector
-version: "1.0.0"
-description: "A sample connector configuration"
-
-source:
-  type: api
-  url: "https://api.example.com"
-destination:
-  type: database
-  connection:
-    host: localhost
-    port: 5432
-    database: example_db
-
-transformations:
-  - type: field_mapping
-    mappings:
-      id: user_id
-      name: full_name
-      email: email_address
-"""
-
-    def set_current_tab(self, tab: str):
-        """Set the current active tab."""
-        self.current_tab = tab
-
-    def set_chat_input(self, value: str):
-        """Set the chat input value."""
-        self.chat_input = value
+        self.yaml_content = DEFAULT_YAML_CONTENT
 
     async def send_message(self):
         """Send a message to the chat agent and get streaming response."""
         if not self.chat_input.strip():
             return
 
-        from .chat_agent import SessionDeps, chat_agent
-
         user_message = self.chat_input.strip()
-        self.chat_messages.append({"role": "user", "content": user_message})
+        self._append_chat_message("user", user_message)
         self.chat_input = ""
         self.chat_loading = True
         self.current_streaming_message = ""
@@ -122,25 +164,39 @@ transformations:
                 async with chat_agent.run_stream(
                     user_message, deps=session_deps
                 ) as response:
-                    async for text in response.stream_text():
-                        self.current_streaming_message = text
-                        yield
-
-                self.chat_messages.append(
-                    {"role": "assistant", "content": self.current_streaming_message}
-                )
+                    pending: list[str] = []
+
+                    async def receive_deltas():
+                        async for delta in response.stream_text(delta=True):
+                            pending.append(delta)
+
+                    # Receive tokens in a separate task so the LLM stream is
+                    # never blocked on UI updates, and flush the buffered text
+                    # to the client at a fixed cadence.
+                    receiver = asyncio.create_task(receive_deltas())
+                    try:
+                        while not receiver.done():
+                            await asyncio.wait(
+                                {receiver}, timeout=STREAM_FLUSH_INTERVAL_SECONDS
+                            )
+                            if pending:
+                                self.current_streaming_message += "".join(pending)
+                                pending.clear()
+                                yield
+                    finally:
+                        receiver.cancel()
+                    await receiver
+
+                self._append_chat_message("assistant", self.current_streaming_message)
                 self.current_streaming_message = ""
 
-                if session_deps.yaml_content != self.yaml_content:
+                if session_deps.yaml_content_modified:
                     self.yaml_content = session_deps.yaml_content
                     yield  # Trigger UI update for yaml_content change
 
         except Exception as e:
-            self.chat_messages.append(
-                {
-                    "role": "assistant",
-                    "content": f"Sorry, I encountered an error: {str(e)}",
-                }
+            self._append_chat_message(
+                "assistant", f"Sorry, I encountered an error: {str(e)}"
             )
             self.current_streaming_message = ""
         finally:
@@ -163,11 +219,12 @@ def connector_builder_tabs() -> rx.Component:
                 documentation_urls=ConnectorBuilderState.documentation_urls,
                 functional_requirements=ConnectorBuilderState.functional_requirements,
                 test_list=ConnectorBuilderState.test_list,
-                on_source_api_name_change=ConnectorBuilderState.set_source_api_name,
-                on_connector_name_change=ConnectorBuilderState.set_connector_name,
-                on_documentation_urls_change=ConnectorBuilderState.set_documentation_urls,
-                on_functional_requirements_change=ConnectorBuilderState.set_functional_requirements,
-                on_test_list_change=ConnectorBuilderState.set_test_list,
+                fields_disabled=ConnectorBuilderState.fields_disabled,
+                on_source_api_name_change=ConnectorBuilderState.commit_source_api_name,
+                on_connector_name_change=ConnectorBuilderState.commit_connector_name,
+                on_documentation_urls_change=ConnectorBuilderState.commit_documentation_urls,
+                on_functional_requirements_change=ConnectorBuilderState.commit_functional_requirements,
+                on_test_list_change=ConnectorBuilderState.commit_test_list,
             ),
             value="requirements",
         ),
@@ -180,6 +237,7 @@ def connector_builder_tabs() -> rx.Component:
                 yaml_content=ConnectorBuilderState.yaml_content,
                 on_change=ConnectorBuilderState.update_yaml_content,
                 on_reset=ConnectorBuilderState.reset_yaml_content,
+                content_length=ConnectorBuilderState.yaml_content_length,
             ),
             value="code",
         ),
@@ -199,12 +257,15 @@ def index() -> rx.Component:
     return rx.box(
         rx.box(
             chat_sidebar(
-                messages=ConnectorBuilderState.chat_messages,
+                message_roles=ConnectorBuilderState.visible_chat_roles,
+                message_contents=ConnectorBuilderState.visible_chat_contents,
+                hidden_message_count=ConnectorBuilderState.hidden_chat_message_count,
                 current_streaming_message=ConnectorBuilderState.current_streaming_message,
                 input_value=ConnectorBuilderState.chat_input,
                 loading=ConnectorBuilderState.chat_loading,
                 on_input_change=ConnectorBuilderState.set_chat_input,
                 on_send=ConnectorBuilderState.send_message,
+                on_show_earlier=ConnectorBuilderState.show_earlier_messages,
             ),
             position="fixed",
             left="0",
@@ -249,6 +310,25 @@ def index() -> rx.Component:
     )
 
 
+@contextlib.asynccontextmanager
+async def chat_agent_lifespan():
+    """Keep the chat agent's MCP server running for the lifetime of the app.
+
+    While the agent context is held open here, the `async with chat_agent:` in
+    `send_message` only bumps a reference count instead of spawning the MCP
+    subprocess for every message. If startup fails, each message falls back
+    to starting the server on demand.
+    """
+    async with contextlib.AsyncExitStack() as stack:
+        try:
+            await stack.enter_async_context(chat_agent)
+        except Exception:
+            logging.getLogger(__name__).warning(
+                "Could not start the chat agent MCP server", exc_info=True
+            )
+        yield
+
+
 # Create the Reflex app
 app = rx.App(
     theme=rx.theme(
@@ -261,3 +341,5 @@ app = rx.App(
 
 # Add the main page
 app.add_page(index, route="/", title="Agentic Connector Builder")
+
+app.register_lifespan_task(chat_agent_lifespan)
@@ -1,6 +1,6 @@
 """Simple PydanticAI chat agent for connector building assistance."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Annotated, Any
 
 from pydantic import Field
@@ -15,6 +15,79 @@ MANIFEST_TOOLS = {
     "execute_dynamic_manifest_resolution_test",
 }
 
+SYSTEM_PROMPT = (
+    "You are a helpful assistant for the Agentic Connector Builder. "
+    "You help users build data connectors by answering questions about "
+    "YAML configuration, connector requirements, data transformations, "
+    "and best practices. You have access to tools for validating manifests, "
+    "testing streams, generating scaffolds, and more. You can also access "
+    "the current state of the user's work including their YAML configuration "
+    "and connector metadata. Be concise and helpful.\n\n"
+    "IMPORTANT: You MUST emit status messages when using tools. These messages help users "
+    "understand what you're doing:\n\n"
+    "1. Acknowledge the user's request before you start.\n"
+    "2. BEFORE calling any tool, emit: '🛠️ Now running [tool name] to [purpose]...'\n"
+    "   Example: '🛠️ Now running Validate Connector Manifest to check your configuration...'\n\n"
+    "3. AFTER successful tool execution, emit: '✅ Tool completed, [summary]...'\n"
+    "   Example: '✅ Tool completed, successfully retrieved development checklist with 15 items.'\n\n"
+    "4. AFTER failed tool execution, emit: '❌ Tool failed, [summary]...'\n"
+    "   Example: '❌ Tool failed, manifest validation errors: missing required fields.'\n\n"
+    "5. When planning next actions, emit: '⚙️ Next, I'll [what you plan to do]...'\n"
+    "   Example: '⚙️ Next, I'll validate the updated manifest to ensure all fields are correct.'\n\n"
+    "Always include these status messages in your responses - they are required for all tool interactions."
+    "\n\n"
+    "IMPORTANT: When using tools like validate_manifest, execute_stream_test_read, "
+    "execute_record_counts_smoke_test, and execute_dynamic_manifest_resolution_test, "
+    "you do NOT need to provide the 'manifest' parameter - it will be automatically "
+    "provided from the current YAML editor content. Just provide the other required "
+    "parameters like config, stream_name, etc."
+)
+
+
+_prepared_manifest_tools: dict[str, ToolDefinition] = {}
+
+
+def _make_manifest_optional(tool_def: ToolDefinition) -> ToolDefinition:
+    """Return a copy of a manifest tool definition with `manifest` made optional."""
+    schema = tool_def.parameters_json_schema.copy()
+
+    if "required" in schema and "manifest" in schema["required"]:
+        required = [r for r in schema["required"] if r != "manifest"]
+        schema["required"] = required
+
+    if "properties" in schema and "manifest" in schema["properties"]:
+        schema["properties"] = {**schema["properties"]}
+        schema["properties"]["manifest"] = {
+            **schema["properties"]["manifest"],
+            "description": (
+                "Auto-provided from current YAML editor content. "
+                "You do not need to provide this parameter."
+            ),
+        }
+
+    return ToolDefinition(
+        name=tool_def.name,
+        description=tool_def.description,
+        parameters_json_schema=schema,
+        metadata=tool_def.metadata,
+    )
+
+
+def _prepare_tool(tool_def: ToolDefinition) -> ToolDefinition:
+    """Return the prepared definition for a tool, building it at most once per name.
+
+    MCP tool schemas are static for the lifetime of the server, so the
+    modified manifest tool definitions are cached by tool name.
+    """
+    if tool_def.name not in MANIFEST_TOOLS:
+        return tool_def
+
+    prepared = _prepared_manifest_tools.get(tool_def.name)
+    if prepared is None:
+        prepared = _make_manifest_optional(tool_def)
+        _prepared_manifest_tools[tool_def.name] = prepared
+    return prepared
+
 
 async def prepare_mcp_tools(
     ctx: RunContext["SessionDeps"],
@@ -25,38 +98,7 @@ async def prepare_mcp_tools(
     This allows the LLM to call manifest-requiring tools without providing
     the manifest parameter, which will be auto-injected during execution.
     """
-    modified_tools = []
-
-    for tool_def in tool_defs:
-        if tool_def.name in MANIFEST_TOOLS:
-            schema = tool_def.parameters_json_schema.copy()
-
-            if "required" in schema and "manifest" in schema["required"]:
-                required = [r for r in schema["required"] if r != "manifest"]
-                schema["required"] = required
-
-            if "properties" in schema and "manifest" in schema["properties"]:
-                schema["properties"] = {**schema["properties"]}
-                schema["properties"]["manifest"] = {
-                    **schema["properties"]["manifest"],
-                    "description": (
-                        "Auto-provided from current YAML editor content. "
-                        "You do not need to provide this parameter."
-                    ),
-                }
-
-            modified_tools.append(
-                ToolDefinition(
-                    name=tool_def.name,
-                    description=tool_def.description,
-                    parameters_json_schema=schema,
-                    metadata=tool_def.metadata,
-                )
-            )
-        else:
-            modified_tools.append(tool_def)
-
-    return modified_tools
+    return [_prepare_tool(tool_def) for tool_def in tool_defs]
 
 
 async def process_tool_call(
@@ -65,10 +107,13 @@ async def process_tool_call(
     name: str,
     tool_args: dict[str, Any],
 ) -> ToolResult:
-    """Inject yaml_content from deps into MCP tool calls that need manifest."""
-    if name in MANIFEST_TOOLS and ctx.deps:
-        if not tool_args.get("manifest"):
-            tool_args = {**tool_args, "manifest": ctx.deps.yaml_content}
+    """Inject yaml_content from deps into MCP tool calls that need manifest.
+
+    `tool_args` is the per-call dict produced by argument validation, so the
+    manifest is written into it directly rather than copying the arguments.
+    """
+    if name in MANIFEST_TOOLS and ctx.deps and not tool_args.get("manifest"):
+        tool_args["manifest"] = ctx.deps.yaml_content
 
     return await call_tool(name, tool_args)
 
@@ -83,6 +128,22 @@ class SessionDeps:
     documentation_urls: str
     functional_requirements: str
     test_list: str
+    yaml_content_modified: bool = False
+    _lines_cache: tuple[str, list[str]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def manifest_lines(self) -> list[str]:
+        """Return `yaml_content` split into lines; callers must not mutate it.
+
+        The split is reused across reads until `yaml_content` is reassigned,
+        which every edit does, so the cache needs no explicit invalidation.
+        """
+        cache = self._lines_cache
+        if cache is None or cache[0] is not self.yaml_content:
+            cache = (self.yaml_content, _split_lines(self.yaml_content))
+            self._lines_cache = cache
+        return cache[1]
 
 
 mcp_server = MCPServerStdio(
@@ -99,36 +160,8 @@ prepared_mcp_server = mcp_server.prepared(prepare_mcp_tools)
 chat_agent = Agent(
     "openai:gpt-4o-mini",
     deps_type=SessionDeps,
-    system_prompt=(
-        "You are a helpful assistant for the Agentic Connector Builder. "
-        "You help users build data connectors by answering questions about "
-        "YAML configuration, connector requirements, data transformations, "
-        "and best practices. You have access to tools for validating manifests, "
-        "testing streams, generating scaffolds, and more. You can also access "
-        "the current state of the user's work including their YAML configuration "
-        "and connector metadata. Be concise and helpful.\n\n"
-        "IMPORTANT: You MUST emit status messages when using tools. These messages help users "
-        "understand what you're doing:\n\n"
-        "1. Acknowledge the user's request before you start.\n"
-        "2. BEFORE calling any tool, emit: '🛠️ Now running [tool name] to [purpose]...'\n"
-        "   Example: '🛠️ Now running Validate Connector Manifest to check your configuration...'\n\n"
-        "3. AFTER successful tool execution, emit: '✅ Tool completed, [summary]...'\n"
-        "   Example: '✅ Tool completed, successfully retrieved development checklist with 15 items.'\n\n"
-        "4. AFTER failed tool execution, emit: '❌ Tool failed, [summary]...'\n"
-        "   Example: '❌ Tool failed, manifest validation errors: missing required fields.'\n\n"
-        "5. When planning next actions, emit: '⚙️ Next, I'll [what you plan to do]...'\n"
-        "   Example: '⚙️ Next, I'll validate the updated manifest to ensure all fields are correct.'\n\n"
-        "Always include these status messages in your responses - they are required for all tool interactions."
-        "and connector metadata."
-        "\n\n"
-        "IMPORTANT: When using tools like validate_manifest, execute_stream_test_read, "
-        "execute_record_counts_smoke_test, and execute_dynamic_manifest_resolution_test, "
-        "you do NOT need to provide the 'manifest' parameter - it will be automatically "
-        "provided from the current YAML editor content. Just provide the other required "
-        "parameters like config, stream_name, etc."
-        "\n\n"
-        "Be concise and helpful."
-    ),
+    defer_model_check=True,
+    system_prompt=SYSTEM_PROMPT,
     toolsets=[prepared_mcp_server],
 )
 
@@ -204,31 +237,33 @@ def get_manifest_text(
         if not ctx.deps.yaml_content:
             return "Error: No YAML content available in session"
 
-        lines = ctx.deps.yaml_content.splitlines()
+        lines = ctx.deps.manifest_lines()
+        total_lines = len(lines)
+
+        if start_line is not None and (start_line < 1 or start_line > total_lines):
+            return f"Error: start_line {start_line} is out of range (content has {total_lines} lines)"
 
-        if start_line is not None:
-            if start_line < 1 or start_line > len(lines):
-                return f"Error: start_line {start_line} is out of range (content has {len(lines)} lines)"
-            lines = lines[start_line - 1 :]
+        effective_start = start_line if start_line is not None else 1
 
         if end_line is not None:
-            effective_start = start_line if start_line is not None else 1
-            total_lines = len(ctx.deps.yaml_content.splitlines())
             if end_line < effective_start:
                 return (
                     f"Error: end_line {end_line} is before start_line {effective_start}"
                 )
-            if end_line > len(lines) + (start_line - 1 if start_line else 0):
+            if end_line > total_lines:
                 return f"Error: end_line {end_line} is out of range (content has {total_lines} lines)"
-            lines_to_keep = end_line - effective_start + 1
-            lines = lines[:lines_to_keep]
+
+        effective_end = end_line if end_line is not None else total_lines
+        lines = lines[effective_start - 1 : effective_end]
 
         if with_line_numbers:
-            start_num = start_line if start_line is not None else 1
-            numbered_lines = [
-                f"{i + start_num:4d} | {line}" for i, line in enumerate(lines)
-            ]
-            return "\n".join(numbered_lines)
+            # str.join materializes a generator into a list first anyway
+            return "\n".join(
+                [
+                    f"{i:4d} | {line}"
+                    for i, line in enumerate(lines, start=effective_start)
+                ]
+            )
 
         return "\n".join(lines)
 
@@ -236,6 +271,41 @@ def get_manifest_text(
         return f"Error reading manifest content: {str(e)}"
 
 
+def _split_lines(content: str) -> list[str]:
+    """Split content on "\n" only, ignoring a trailing newline.
+
+    This matches `_count_lines` and `_find_line_offset`. `str.splitlines` also
+    breaks on characters such as "\r" and "\x0c", which would make the line
+    numbers shown to the agent disagree with the lines its edits address.
+    """
+    lines = content.split("\n")
+    if content.endswith("\n"):
+        lines.pop()
+    return lines
+
+
+def _count_lines(content: str) -> int:
+    """Count the lines in non-empty content, ignoring a trailing newline."""
+    return content.count("\n") + (not content.endswith("\n"))
+
+
+def _find_line_offset(
+    content: str, line_index: int, start_offset: int = 0, start_index: int = 0
+) -> int:
+    """Return the character offset at which the 0-indexed `line_index` begins.
+
+    Scanning resumes from `start_offset`, which must be the beginning of line
+    `start_index`. Lines past the end of the content map to `len(content)`.
+    """
+    offset = start_offset
+    for _ in range(line_index - start_index):
+        newline = content.find("\n", offset)
+        if newline == -1:
+            return len(content)
+        offset = newline + 1
+    return offset
+
+
 @chat_agent.tool
 def insert_manifest_lines(
     ctx: RunContext[SessionDeps],
@@ -270,18 +340,25 @@ def insert_manifest_lines(
         if not ctx.deps.yaml_content:
             return "Error: No YAML content available in session"
 
-        file_lines = ctx.deps.yaml_content.splitlines(keepends=False)
-
         if line_number < 1:
             return f"Error: line_number must be >= 1, got {line_number}"
 
+        content = ctx.deps.yaml_content
         new_lines = lines.splitlines(keepends=False)
         num_new_lines = len(new_lines)
 
-        insert_pos = min(line_number - 1, len(file_lines))
-        result_lines = file_lines[:insert_pos] + new_lines + file_lines[insert_pos:]
-
-        ctx.deps.yaml_content = "\n".join(result_lines)
+        if new_lines:
+            insert_pos = min(line_number - 1, _count_lines(content))
+            offset = _find_line_offset(content, insert_pos)
+            block = "\n".join(new_lines)
+            if offset == len(content) and not content.endswith("\n"):
+                block = "\n" + block
+            else:
+                block += "\n"
+            # One join allocates the result once; chained `+` would copy the
+            # prefix into an intermediate string first.
+            ctx.deps.yaml_content = "".join((content[:offset], block, content[offset:]))
+            ctx.deps.yaml_content_modified = True
 
         return f"Successfully inserted {num_new_lines} line(s) at line {line_number}. The manifest has been updated and changes are visible in the UI."
 
@@ -324,24 +401,30 @@ def replace_manifest_lines(
         if not ctx.deps.yaml_content:
             return "Error: No YAML content available in session"
 
-        file_lines = ctx.deps.yaml_content.splitlines(keepends=False)
+        content = ctx.deps.yaml_content
+        total_lines = _count_lines(content)
 
-        if start_line < 1 or start_line > len(file_lines):
-            return f"Error: start_line {start_line} is out of range (content has {len(file_lines)} lines)"
+        if start_line < 1 or start_line > total_lines:
+            return f"Error: start_line {start_line} is out of range (content has {total_lines} lines)"
         if end_line < start_line:
             return f"Error: end_line {end_line} is before start_line {start_line}"
-        if end_line > len(file_lines):
-            return f"Error: end_line {end_line} is out of range (content has {len(file_lines)} lines)"
+        if end_line > total_lines:
+            return f"Error: end_line {end_line} is out of range (content has {total_lines} lines)"
 
         replacement_lines = new_lines.splitlines(keepends=False)
         num_replacement_lines = len(replacement_lines)
         num_replaced = end_line - start_line + 1
 
-        result_lines = (
-            file_lines[: start_line - 1] + replacement_lines + file_lines[end_line:]
-        )
+        start_offset = _find_line_offset(content, start_line - 1)
+        end_offset = _find_line_offset(content, end_line, start_offset, start_line - 1)
+        replacement = "\n".join(replacement_lines)
+        if replacement_lines and content[end_offset - 1] == "\n":
+            replacement += "\n"
 
-        ctx.deps.yaml_content = "\n".join(result_lines)
+        ctx.deps.yaml_content = "".join(
+            (content[:start_offset], replacement, content[end_offset:])
+        )
+        ctx.deps.yaml_content_modified = True
 
         return f"Successfully replaced {num_replaced} line(s) (lines {start_line}-{end_line}) with {num_replacement_lines} new line(s). The manifest has been updated and changes are visible in the UI."
 
@@ -3,53 +3,95 @@
 import reflex as rx
 
 
-def chat_bubble(message_str, is_user: bool) -> rx.Component:
-    """Render a chat bubble."""
+def _bubble(message_str, text_color: str, **props) -> rx.Component:
+    """Render a chat bubble with the shared card styling."""
     return rx.card(
-        rx.text(
-            message_str,
-            size="2",
-            color=rx.cond(is_user, "white", "gray.100"),
-        ),
-        background=rx.cond(is_user, "blue.500", "gray.800"),
+        rx.text(message_str, size="2", color=text_color),
         border="1px solid silver",
         padding="20",
         p="20",
         border_radius="16px",
         max_width="85%",
-        align_self=rx.cond(is_user, "flex-end", "flex-start"),
-        margin_left=rx.cond(is_user, "auto", "8px"),
-        margin_right=rx.cond(is_user, "8px", "auto"),
         margin_top="4px",
         margin_bottom="4px",
+        **props,
+    )
+
+
+def user_bubble(message_str) -> rx.Component:
+    """Render a right-aligned bubble for a user message."""
+    return _bubble(
+        message_str,
+        text_color="white",
+        background="blue.500",
+        align_self="flex-end",
+        margin_left="auto",
+        margin_right="8px",
+    )
+
+
+def assistant_bubble(message_str) -> rx.Component:
+    """Render a left-aligned bubble for an assistant message."""
+    return _bubble(
+        message_str,
+        text_color="gray.100",
+        background="gray.800",
+        align_self="flex-start",
+        margin_left="8px",
+        margin_right="auto",
     )
 
 
-def chat_message(message: dict) -> rx.Component:
-    """Render a single chat message."""
-    return chat_bubble(
-        message["content"],
-        is_user=message["role"] == "user",
+def chat_message(role, content) -> rx.Component:
+    """Render a single chat message.
+
+    The role is only known client-side, so a single `rx.cond` picks between
+    the two statically styled bubbles.
+    """
+    return rx.cond(
+        role == "user",
+        user_bubble(content),
+        assistant_bubble(content),
     )
 
 
 def streaming_message(content: str) -> rx.Component:
-    """Render the currently streaming message."""
-    return chat_bubble(
-        content + "\n\n ... ",
-        is_user=False,
+    """Render the currently streaming message.
+
+    While a reply is streaming this is updated several times per second, so
+    it is a bare text span rather than a full card. The styled bubble is
+    mounted once the message is finalized into the chat history.
+    """
+    return rx.el.div(
+        rx.el.span(content + " …"),
+        white_space="pre-wrap",
+        font_size="var(--font-size-2)",
+        color="gray.100",
+        align_self="flex-start",
+        max_width="85%",
+        margin_left="8px",
+        margin_top="4px",
+        margin_bottom="4px",
+        padding="12px 16px",
     )
 
 
 def chat_sidebar(
-    messages,
+    message_roles,
+    message_contents,
+    hidden_message_count,
     current_streaming_message,
     input_value,
     loading,
     on_input_change,
     on_send,
+    on_show_earlier,
 ) -> rx.Component:
-    """Create the fixed chat sidebar component."""
+    """Create the fixed chat sidebar component.
+
+    Only the most recent window of messages is rendered; older messages are
+    mounted on demand via the "Show earlier messages" button.
+    """
     return rx.vstack(
         rx.vstack(
             rx.heading("💬 Chat Assistant", size="7", weight="bold"),
@@ -67,7 +109,21 @@ def chat_sidebar(
         ),
         rx.scroll_area(
             rx.vstack(
-                rx.foreach(messages, chat_message),
+                rx.cond(
+                    hidden_message_count > 0,
+                    rx.button(
+                        "Show earlier messages",
+                        on_click=on_show_earlier,
+                        variant="ghost",
+                        size="1",
+                        align_self="center",
+                    ),
+                    rx.fragment(),
+                ),
+                rx.foreach(
+                    message_contents,
+                    lambda content, index: chat_message(message_roles[index], content),
+                ),
                 rx.cond(
                     current_streaming_message,
                     streaming_message(current_streaming_message),
@@ -4,8 +4,16 @@ import reflex as rx
 from reflex_monaco import monaco
 
 
-def yaml_editor_component(yaml_content: str, on_change, on_reset) -> rx.Component:
-    """Create the Monaco YAML editor component."""
+def yaml_editor_component(
+    yaml_content: str, on_change, on_reset, content_length: int | None = None
+) -> rx.Component:
+    """Create the Monaco YAML editor component.
+
+    The character counter shows ``content_length``, or the length of
+    ``yaml_content`` computed in the browser when it is not given.
+    """
+    if content_length is None:
+        content_length = rx.Var.create(yaml_content).length()
     return rx.vstack(
         rx.heading("YAML Connector Configuration Editor", size="6", mb=4),
         rx.hstack(
@@ -17,7 +25,11 @@ def yaml_editor_component(yaml_content: str, on_change, on_reset) -> rx.Componen
             ),
             rx.spacer(),
             rx.text(
-                "Content length will be calculated dynamically",
+                "Content length: ",
+                content_length,
+                " characters",
+                id="content-length-counter",
+                custom_attrs={"data-length": content_length},
                 color="gray.600",
                 size="2",
             ),
@@ -1,10 +1,26 @@
 """Progress tab component."""
 
+import functools
+
 import reflex as rx
 
+_MUTED = {"color": "gray.400"}
+
+_PROGRESS_STEPS: tuple[str, ...] = (
+    "Requirements defined",
+    "Configuration completed",
+    "Testing completed",
+    "Ready for deployment",
+)
 
+
+@functools.lru_cache(maxsize=1)
 def progress_tab_content() -> rx.Component:
-    """Placeholder content for Progress tab."""
+    """Placeholder content for Progress tab.
+
+    The tree is static, so it is built once and the same component is
+    returned on subsequent calls.
+    """
     return rx.vstack(
         rx.heading("Progress", size="6", mb=4),
         rx.text(
@@ -14,26 +30,14 @@ def progress_tab_content() -> rx.Component:
             mb=4,
         ),
         rx.vstack(
-            rx.hstack(
-                rx.text("○", color="gray.400"),
-                rx.text("Requirements defined", color="gray.400"),
-                spacing="2",
-            ),
-            rx.hstack(
-                rx.text("○", color="gray.400"),
-                rx.text("Configuration completed", color="gray.400"),
-                spacing="2",
-            ),
-            rx.hstack(
-                rx.text("○", color="gray.400"),
-                rx.text("Testing completed", color="gray.400"),
-                spacing="2",
-            ),
-            rx.hstack(
-                rx.text("○", color="gray.400"),
-                rx.text("Ready for deployment", color="gray.400"),
-                spacing="2",
-            ),
+            *[
+                rx.hstack(
+                    rx.text("○", **_MUTED),
+                    rx.text(label, **_MUTED),
+                    spacing="2",
+                )
+                for label in _PROGRESS_STEPS
+            ],
             spacing="3",
             align="start",
             mb=6,
@@ -4,6 +4,27 @@ from collections.abc import Callable
 
 import reflex as rx
 
+# Delay before a typing burst in a single-line input is synced to state.
+# Multi-line text areas are uncontrolled and only commit on blur.
+INPUT_DEBOUNCE_MS = 150
+
+# Shared style props, splatted into components so each render reuses them.
+_HINT = {"color": "gray.400", "size": "2"}
+_FULL = {"width": "100%"}
+_FIELD_VSTACK = {"spacing": "2", "align": "start", "width": "100%"}
+
+
+def _labeled_field(
+    label: str, widget: rx.Component, hint: str | None = None
+) -> rx.Component:
+    """Stack a bold label, an optional hint line, and a form widget."""
+    return rx.vstack(
+        rx.text(label, weight="bold", size="3"),
+        *([rx.text(hint, **_HINT)] if hint else []),
+        widget,
+        **_FIELD_VSTACK,
+    )
+
 
 def requirements_tab_content(
     source_api_name: str,
@@ -11,6 +32,7 @@ def requirements_tab_content(
     documentation_urls: str,
     functional_requirements: str,
     test_list: str,
+    fields_disabled: bool,
     on_source_api_name_change: Callable[[str], None],
     on_connector_name_change: Callable[[str], None],
     on_documentation_urls_change: Callable[[str], None],
@@ -25,14 +47,13 @@ def requirements_tab_content(
         documentation_urls: Current value of the documentation URLs field
         functional_requirements: Current value of the functional requirements field
         test_list: Current value of the test list field
+        fields_disabled: Whether the fields after the source API name are disabled
         on_source_api_name_change: Callback for source API name changes
         on_connector_name_change: Callback for connector name changes
         on_documentation_urls_change: Callback for documentation URLs changes
         on_functional_requirements_change: Callback for functional requirements changes
         on_test_list_change: Callback for test list changes
     """
-    fields_disabled = source_api_name.strip() == ""
-
     return rx.vstack(
         rx.heading("Requirements", size="6", mb=4),
         rx.text(
@@ -41,92 +62,78 @@ def requirements_tab_content(
             size="4",
             mb=6,
         ),
-        rx.vstack(
-            rx.text("Source API name", weight="bold", size="3"),
-            rx.input(
-                placeholder="e.g., GitHub API, Stripe API, Salesforce API",
+        _labeled_field(
+            "Source API name",
+            rx.debounce_input(
+                rx.input(
+                    placeholder="e.g., GitHub API, Stripe API, Salesforce API",
+                    on_change=on_source_api_name_change,
+                    **_FULL,
+                    size="3",
+                ),
                 value=source_api_name,
-                on_change=on_source_api_name_change,
-                width="100%",
-                size="3",
+                debounce_timeout=INPUT_DEBOUNCE_MS,
             ),
-            spacing="2",
-            align="start",
-            width="100%",
         ),
-        rx.vstack(
-            rx.text("Connector name", weight="bold", size="3"),
-            rx.input(
-                placeholder="e.g., source-github, source-stripe",
+        _labeled_field(
+            "Connector name",
+            rx.debounce_input(
+                rx.input(
+                    placeholder="e.g., source-github, source-stripe",
+                    on_change=on_connector_name_change,
+                    disabled=fields_disabled,
+                    **_FULL,
+                    size="3",
+                ),
                 value=connector_name,
-                on_change=on_connector_name_change,
-                disabled=fields_disabled,
-                width="100%",
-                size="3",
+                debounce_timeout=INPUT_DEBOUNCE_MS,
             ),
-            spacing="2",
-            align="start",
-            width="100%",
         ),
-        rx.vstack(
-            rx.text("Documentation URLs (Optional)", weight="bold", size="3"),
-            rx.text(
-                "Enter each URL on a new line",
-                color="gray.400",
-                size="2",
-            ),
+        _labeled_field(
+            "Documentation URLs (Optional)",
             rx.text_area(
                 placeholder="https://docs.example.com/api\nhttps://developer.example.com/reference",
-                value=documentation_urls,
-                on_change=on_documentation_urls_change,
+                default_value=documentation_urls,
+                on_blur=on_documentation_urls_change,
+                # The field is uncontrolled, so remount it when the committed
+                # value changes elsewhere.
+                key=documentation_urls,
                 disabled=fields_disabled,
-                width="100%",
+                **_FULL,
                 height="100px",
                 resize="vertical",
             ),
-            spacing="2",
-            align="start",
-            width="100%",
+            hint="Enter each URL on a new line",
         ),
-        rx.vstack(
-            rx.text(
-                "Additional functional requirements (Optional)", weight="bold", size="3"
-            ),
+        _labeled_field(
+            "Additional functional requirements (Optional)",
             rx.text_area(
                 placeholder="Describe any specific requirements, rate limits, authentication needs, etc.",
-                value=functional_requirements,
-                on_change=on_functional_requirements_change,
+                default_value=functional_requirements,
+                on_blur=on_functional_requirements_change,
+                key=functional_requirements,
                 disabled=fields_disabled,
-                width="100%",
+                **_FULL,
                 height="120px",
                 resize="vertical",
             ),
-            spacing="2",
-            align="start",
-            width="100%",
         ),
-        rx.vstack(
-            rx.text("List of tests (Optional)", weight="bold", size="3"),
-            rx.text(
-                "Write each test as an assertion, one per line",
-                color="gray.400",
-                size="2",
-            ),
+        _labeled_field(
+            "List of tests (Optional)",
             rx.text_area(
                 placeholder=(
                     "All streams should have at least 50 records.\n"
                     "The 'transactions' stream should have at least a thousand records."
                 ),
-                value=test_list,
-                on_change=on_test_list_change,
+                default_value=test_list,
+                on_blur=on_test_list_change,
+                key=test_list,
                 disabled=fields_disabled,
-                width="100%",
+                **_FULL,
                 height="120px",
                 resize="vertical",
             ),
-            spacing="2",
-            align="start",
-            width="100%",
+            hint="Write each test as an assertion, one per line",
         ),
         spacing="6",
         align="start",
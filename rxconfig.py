@@ -2,8 +2,9 @@ import reflex as rx
 
 config = rx.Config(
     app_name="app",
+    state_auto_setters=True,
     plugins=[
         rx.plugins.SitemapPlugin(),
         rx.plugins.TailwindV3Plugin(),
-    ]
+    ],
 )
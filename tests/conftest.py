@@ -1,19 +1,8 @@
 """Pytest configuration and fixtures for agentic-connector-builder-webapp tests."""
 
-import sys
-from pathlib import Path
-
 import pytest
 
-# Add src directory to Python path for imports
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
-
-
-@pytest.fixture
-def sample_yaml_content():
-    """Fixture providing sample YAML content for testing."""
-    return """# Test YAML configuration
+SAMPLE_YAML_CONTENT = """# Test YAML configuration
 name: test-connector
 version: "1.0.0"
 description: "A test connector configuration"
@@ -35,6 +24,21 @@ transformations:
       name: full_name
 """
 
+INVALID_YAML_CONTENT = """# Invalid YAML - missing quotes and improper indentation
+name: test-connector
+version: 1.0.0
+description: A test connector
+  invalid_indentation: true
+source:
+type: api
+"""
+
+
+@pytest.fixture
+def sample_yaml_content():
+    """Fixture providing sample YAML content for testing."""
+    return SAMPLE_YAML_CONTENT
+
 
 @pytest.fixture
 def empty_yaml_content():
@@ -45,22 +49,25 @@ def empty_yaml_content():
 @pytest.fixture
 def invalid_yaml_content():
     """Fixture providing invalid YAML content for testing."""
-    return """# Invalid YAML - missing quotes and improper indentation
-name: test-connector
-version: 1.0.0
-description: A test connector
-  invalid_indentation: true
-source:
-type: api
-"""
+    return INVALID_YAML_CONTENT
 
 
 @pytest.fixture
 def yaml_editor_state():
     """Fixture providing a ConnectorBuilderState instance for testing."""
-    from agentic_connector_builder_webapp.agentic_connector_builder_webapp import (
-        ConnectorBuilderState,
-    )
+    from app.app import ConnectorBuilderState
+
+    return ConnectorBuilderState()
+
+
+@pytest.fixture(scope="module")
+def yaml_editor_state_readonly():
+    """Fixture providing a ConnectorBuilderState shared by a module's tests.
+
+    Only for tests that never mutate the state; use ``yaml_editor_state``
+    otherwise.
+    """
+    from app.app import ConnectorBuilderState
 
     return ConnectorBuilderState()
 
@@ -0,0 +1,225 @@
+"""YAML documents shared by the end-to-end tests."""
+
+import functools
+
+SAMPLE_YAML = """# E2E Test YAML
+name: e2e-test-connector
+version: "2.0.0"
+description: "End-to-end test connector"
+
+source:
+  type: file
+  path: "/data/input.json"
+destination:
+  type: api
+  endpoint: "https://api.test.com/data"
+transformations:
+  - type: json_to_yaml
+  - type: validation
+    rules:
+      - required_fields: ["id", "name"]
+"""
+
+COMPLEX_YAML = """# Complex E2E Test Configuration
+name: complex-e2e-connector
+version: "3.0.0"
+description: "Complex connector for comprehensive testing"
+
+metadata:
+  author: "E2E Test Suite"
+  created: "2024-01-01"
+  tags: ["test", "e2e", "complex"]
+
+source:
+  type: database
+  connection:
+    host: "db.test.com"
+    port: 5432
+    database: "test_db"
+    username: "test_user"
+    password: "${DB_PASSWORD}"
+  query: |
+    SELECT id, name, email, created_at
+    FROM users
+    WHERE active = true
+    ORDER BY created_at DESC
+    LIMIT 1000
+
+destination:
+  type: webhook
+  url: "https://webhook.test.com/data"
+  headers:
+    Content-Type: "application/json"
+    Authorization: "Bearer ${API_TOKEN}"
+  batch_size: 100
+  retry_config:
+    max_retries: 3
+    backoff_factor: 2
+
+transformations:
+  - type: field_mapping
+    mappings:
+      user_id: id
+      full_name: name
+      email_address: email
+      registration_date: created_at
+  - type: data_validation
+    rules:
+      - field: email_address
+        type: email
+        required: true
+      - field: registration_date
+        type: datetime
+        format: "ISO8601"
+  - type: enrichment
+    source: "user_profiles"
+    join_key: "user_id"
+    fields: ["profile_data", "preferences"]
+
+monitoring:
+  enabled: true
+  metrics:
+    - "records_processed"
+    - "processing_time"
+    - "error_rate"
+  alerts:
+    - condition: "error_rate > 0.05"
+      action: "email"
+      recipients: ["admin@test.com"]
+"""
+
+
+@functools.cache
+def large_yaml() -> str:
+    """Build a large connector document with 100 database sources."""
+    parts = [
+        """# Large YAML Configuration File
+name: large-test-connector
+version: "1.0.0"
+description: "Large connector configuration for performance testing"
+
+"""
+    ]
+    for i in range(100):
+        parts.append(f"""
+source_{i:03d}:
+  type: database
+  connection:
+    host: "host-{i:03d}.example.com"
+    port: {5432 + i}
+    database: "db_{i:03d}"
+    username: "user_{i:03d}"
+    password: "password_{i:03d}"
+  tables:
+    - name: "table_{i:03d}_users"
+      columns: ["id", "name", "email", "created_at"]
+    - name: "table_{i:03d}_orders"
+      columns: ["id", "user_id", "amount", "status"]
+""")
+    return "".join(parts)
+
+
+@functools.cache
+def huge_yaml(size_kb: int) -> str:
+    """Build a document of at least ``size_kb`` KiB from database sections.
+
+    Sections hold up to 100 databases of roughly 1KB each, and databases are
+    added only until the requested size is reached.
+    """
+    min_length = size_kb * 1024
+    parts = [
+        """# Extremely Large YAML Configuration
+name: massive-connector-config
+version: "1.0.0"
+description: "Testing state management with extremely large content"
+
+"""
+    ]
+    length = len(parts[0])
+    section_idx = 0
+    while length < min_length:
+        parts.append(f"""
+# Section {section_idx:03d} - Database Configurations
+database_section_{section_idx:03d}:
+  type: "multi_database_section"
+  description: "Section {section_idx:03d} containing multiple database configurations"
+""")
+        for db_idx in range(100):
+            if length >= min_length:
+                break
+            parts.append(f"""  database_{section_idx:03d}_{db_idx:03d}:
+    type: "postgresql"
+    connection:
+      host: "db-{section_idx:03d}-{db_idx:03d}.example.com"
+      port: {5432 + (section_idx * 100) + db_idx}
+      database: "app_db_{section_idx:03d}_{db_idx:03d}"
+      username: "user_{section_idx:03d}_{db_idx:03d}"
+      password: "secure_password_{section_idx:03d}_{db_idx:03d}"
+      ssl_mode: "require"
+      connection_timeout: 30
+      max_connections: 100
+    tables:
+      - name: "users_{section_idx:03d}_{db_idx:03d}"
+        columns: ["id", "username", "email", "created_at", "updated_at", "status"]
+        indexes: ["username", "email", "created_at"]
+      - name: "orders_{section_idx:03d}_{db_idx:03d}"
+        columns: ["id", "user_id", "product_id", "quantity", "price", "order_date"]
+        indexes: ["user_id", "product_id", "order_date"]
+      - name: "products_{section_idx:03d}_{db_idx:03d}"
+        columns: ["id", "name", "description", "price", "category", "stock"]
+        indexes: ["name", "category", "price"]
+    transformations:
+      - type: "data_validation"
+        rules:
+          - field: "email"
+            type: "email"
+            required: true
+          - field: "price"
+            type: "decimal"
+            min: 0
+      - type: "field_mapping"
+        mappings:
+          user_id: "customer_id"
+          order_date: "purchase_timestamp"
+""")
+            length += len(parts[-1])
+        section_idx += 1
+    return "".join(parts)
+
+
+@functools.cache
+def memory_yaml_template() -> str:
+    """Build a ~33KB document template with an ``{iteration}`` placeholder.
+
+    The template has 20 sections of 10 databases each; fill it in with
+    ``str.format(iteration=...)``.
+    """
+    parts = [
+        """# Memory Efficiency Test - Iteration {iteration}
+name: memory-test-connector-{iteration}
+version: "1.{iteration}.0"
+description: "Testing memory efficiency with repeated large operations"
+
+# Large configuration section for iteration {iteration}
+"""
+    ]
+    for section in range(20):
+        parts.append(f"""
+section_{section:02d}:
+  type: "database_cluster"
+  iteration: {section}
+  section_id: {section}
+  databases:
+""")
+        parts.extend(
+            f"""    - name: "db_{section:02d}_{db:02d}"
+      host: "host-{section}-{db}.example.com"
+      port: {5432 + section * 10 + db}
+      config:
+        max_connections: 100
+        timeout: 30
+        ssl: true
+"""
+            for db in range(10)
+        )
+    return "".join(parts)
@@ -1,156 +1,228 @@
 """Playwright configuration and fixtures for end-to-end tests."""
 
 import asyncio
+import importlib.util
 from collections.abc import AsyncGenerator
+from pathlib import Path
 
 import pytest
-from playwright.async_api import Browser, BrowserContext, Page, async_playwright
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    ElementHandle,
+    Page,
+    async_playwright,
+)
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from ._yaml_fixtures import COMPLEX_YAML, SAMPLE_YAML
+
+# Resolves to the editor textarea once Monaco has rendered its container,
+# background layer, and input textarea.
+_MONACO_READY_JS = """() => document.querySelector('.monaco-editor')
+    && document.querySelector('.monaco-editor .monaco-editor-background')
+    && document.querySelector('.monaco-editor textarea')"""
+
+# @monaco-editor/react fetches Monaco (several MB) from this CDN path at runtime.
+_MONACO_CDN_GLOB = "**/npm/monaco-editor@*/**"
+
+# Finishes transitions and animations immediately, so actionability checks do
+# not wait for elements to stop moving.
+_NO_ANIMATIONS_CSS = """*, *::before, *::after {
+    transition: none !important;
+    animation-duration: 0s !important;
+    animation-delay: 0s !important;
+}"""
+
+# playwright.config.py is not importable by name because of the dot in it.
+_config_spec = importlib.util.spec_from_file_location(
+    "playwright_config", Path(__file__).parents[2] / "playwright.config.py"
+)
+playwright_config = importlib.util.module_from_spec(_config_spec)
+_config_spec.loader.exec_module(playwright_config)
 
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Use uvloop for the session's event loop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
 
 
 @pytest.fixture(scope="session")
 async def browser() -> AsyncGenerator[Browser, None]:
     """Create a browser instance for the test session."""
     async with async_playwright() as p:
+        config = playwright_config.get_browser_config("chromium")
         browser = await p.chromium.launch(
-            headless=True, args=["--no-sandbox", "--disable-dev-shm-usage"]
+            headless=config["headless"],
+            slow_mo=config["slow_mo"],
+            args=config["args"],
         )
         yield browser
         await browser.close()
 
 
-@pytest.fixture(scope="function")
-async def context(browser: Browser) -> AsyncGenerator[BrowserContext, None]:
-    """Create a new browser context for each test."""
+async def _new_context(browser: Browser) -> BrowserContext:
+    """Create a browser context with the shared viewport and timeouts."""
+    config = playwright_config.get_browser_config("chromium")
     context = await browser.new_context(
-        viewport={"width": 1280, "height": 720},
-        ignore_https_errors=True,
+        viewport=config["viewport"],
+        ignore_https_errors=config["ignore_https_errors"],
+        reduced_motion="reduce",
+    )
+    context.set_default_timeout(playwright_config.PLAYWRIGHT_CONFIG["action_timeout"])
+    context.set_default_navigation_timeout(
+        playwright_config.PLAYWRIGHT_CONFIG["navigation_timeout"]
     )
+    return context
+
+
+@pytest.fixture(scope="module")
+async def context(browser: Browser) -> AsyncGenerator[BrowserContext, None]:
+    """Create a browser context shared by the tests in one file.
+
+    With ``--dist=loadfile`` each file runs on a single xdist worker, so the
+    context is created once per file without leaking state across files.
+    """
+    context = await _new_context(browser)
     yield context
     await context.close()
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture
+async def isolated_context(browser: Browser) -> AsyncGenerator[BrowserContext, None]:
+    """Create a fresh browser context for a test that needs full isolation."""
+    context = await _new_context(browser)
+    yield context
+    await context.close()
+
+
+@pytest.fixture(scope="module")
 async def page(context: BrowserContext) -> AsyncGenerator[Page, None]:
-    """Create a new page for each test."""
+    """Create a page shared by the tests in one file.
+
+    ``app_page`` resets the app state before each test, so tests that need a
+    differently configured page (e.g. another viewport) should open their own
+    from ``isolated_context``.
+    """
+    await context.clear_cookies()
+    await context.clear_permissions()
     page = await context.new_page()
     yield page
     await page.close()
 
 
+@pytest.fixture(scope="function")
+async def console_logs(page: Page) -> AsyncGenerator[list[str], None]:
+    """Collect the page's console messages for failure diagnostics."""
+    logs: list[str] = []
+
+    def on_console(msg):
+        logs.append(f"{msg.type}: {msg.text}")
+
+    page.on("console", on_console)
+    yield logs
+    page.remove_listener("console", on_console)
+    logs.clear()
+
+
 @pytest.fixture(scope="session")
 def base_url() -> str:
-    """Base URL for the application during testing."""
-    return "http://localhost:3000"
+    """Base URL for the application during testing.
+
+    Every xdist worker targets the same dev server. Reflex keys backend state
+    on a per-tab token, so pages in different workers do not share state.
+    """
+    return playwright_config.get_test_environment_config()["base_url"]
+
+
+async def _load_app(page: Page, base_url: str) -> None:
+    """Load the main application page with a fresh app state."""
+    # The Reflex websocket keeps the network busy, so "networkidle" can stall
+    # until the navigation timeout; wait for the page heading instead.
+    if page.url.startswith(base_url):
+        # Reflex keys the backend state on a token kept in sessionStorage;
+        # dropping it makes the reload start from a new, default state.
+        await page.evaluate("() => sessionStorage.clear()")
+        await page.reload(wait_until="domcontentloaded")
+    else:
+        await page.goto(base_url, wait_until="domcontentloaded")
+    await page.locator("h1", has_text="Agentic Connector Builder").wait_for()
+    await page.add_style_tag(content=_NO_ANIMATIONS_CSS)
 
 
 @pytest.fixture(scope="function")
-async def app_page(page: Page, base_url: str) -> Page:
-    """Navigate to the main application page."""
-    await page.goto(base_url)
-    await page.wait_for_load_state("networkidle")
+async def app_page(page: Page, base_url: str, console_logs: list[str]) -> Page:
+    """Load the main application page with a fresh app state."""
+    await _load_app(page, base_url)
     return page
 
 
+@pytest.fixture(scope="class")
+async def editor_page(browser: Browser, base_url: str) -> AsyncGenerator[Page, None]:
+    """Load the application once for a test class and wait for Monaco.
+
+    The page lives in its own context, so ``app_page`` reloads in the same
+    class never touch it. It is not reloaded between tests, so tests using it
+    must normalize the editor themselves (e.g. with "Reset to Example").
+    """
+    context = await _new_context(browser)
+    page = await context.new_page()
+    await _load_app(page, base_url)
+    await page.wait_for_function(_MONACO_READY_JS, timeout=15000)
+    yield page
+    await context.close()
+
+
+@pytest.fixture
+async def app_page_fast(
+    isolated_context: BrowserContext, base_url: str
+) -> AsyncGenerator[Page, None]:
+    """Load the main application page without fetching Monaco.
+
+    The editor stays on its loading placeholder, so this is only for tests of
+    the page structure around the editor, not of the editor itself.
+    """
+    await isolated_context.route(_MONACO_CDN_GLOB, lambda route: route.abort())
+    page = await isolated_context.new_page()
+    await page.goto(base_url, wait_until="domcontentloaded")
+    await page.locator("h1", has_text="Agentic Connector Builder").wait_for()
+    await page.add_style_tag(content=_NO_ANIMATIONS_CSS)
+    yield page
+    await page.close()
+
+
+@pytest.fixture
+async def monaco_ready(app_page: Page, console_logs: list[str]) -> ElementHandle:
+    """Wait for the Monaco editor to be ready and return its textarea."""
+    timeout = 15000
+    try:
+        ready = await app_page.wait_for_function(_MONACO_READY_JS, timeout=timeout)
+    except PlaywrightTimeoutError as e:
+        raise AssertionError(
+            f"Monaco editor failed to load within {timeout}ms. "
+            f"Error: {str(e)}. "
+            f"Page title: {await app_page.title()}. "
+            f"Console logs: {console_logs[-5:] if console_logs else 'None'}. "
+            f"Monaco elements found: {await app_page.locator('.monaco-editor').count()}"
+        ) from e
+    return ready.as_element()
+
+
 @pytest.fixture
 def sample_yaml_for_e2e() -> str:
     """Sample YAML content for e2e testing."""
-    return """# E2E Test YAML
-name: e2e-test-connector
-version: "2.0.0"
-description: "End-to-end test connector"
-
-source:
-  type: file
-  path: "/data/input.json"
-destination:
-  type: api
-  endpoint: "https://api.test.com/data"
-transformations:
-  - type: json_to_yaml
-  - type: validation
-    rules:
-      - required_fields: ["id", "name"]
-"""
+    return SAMPLE_YAML
 
 
 @pytest.fixture
 def complex_yaml_for_e2e() -> str:
     """Complex YAML content for advanced e2e testing."""
-    return """# Complex E2E Test Configuration
-name: complex-e2e-connector
-version: "3.0.0"
-description: "Complex connector for comprehensive testing"
-
-metadata:
-  author: "E2E Test Suite"
-  created: "2024-01-01"
-  tags: ["test", "e2e", "complex"]
-
-source:
-  type: database
-  connection:
-    host: "db.test.com"
-    port: 5432
-    database: "test_db"
-    username: "test_user"
-    password: "${DB_PASSWORD}"
-  query: |
-    SELECT id, name, email, created_at
-    FROM users
-    WHERE active = true
-    ORDER BY created_at DESC
-    LIMIT 1000
-
-destination:
-  type: webhook
-  url: "https://webhook.test.com/data"
-  headers:
-    Content-Type: "application/json"
-    Authorization: "Bearer ${API_TOKEN}"
-  batch_size: 100
-  retry_config:
-    max_retries: 3
-    backoff_factor: 2
-
-transformations:
-  - type: field_mapping
-    mappings:
-      user_id: id
-      full_name: name
-      email_address: email
-      registration_date: created_at
-  - type: data_validation
-    rules:
-      - field: email_address
-        type: email
-        required: true
-      - field: registration_date
-        type: datetime
-        format: "ISO8601"
-  - type: enrichment
-    source: "user_profiles"
-    join_key: "user_id"
-    fields: ["profile_data", "preferences"]
-
-monitoring:
-  enabled: true
-  metrics:
-    - "records_processed"
-    - "processing_time"
-    - "error_rate"
-  alerts:
-    - condition: "error_rate > 0.05"
-      action: "email"
-      recipients: ["admin@test.com"]
-"""
+    return COMPLEX_YAML
 
 
 # Configure pytest for async tests
@@ -1,55 +1,209 @@
 """End-to-end tests for YAML editor functionality using Playwright."""
 
 import asyncio
+import re
 
 import pytest
-from playwright.async_api import Page, expect
+from playwright.async_api import BrowserContext, ElementHandle, Page, expect
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
+from ._yaml_fixtures import huge_yaml, large_yaml, memory_yaml_template
+
+_COUNTER_RE = re.compile(r"Content length: (\d+) characters")
+_LINE_NUMBER_RE = re.compile(r"^\s*\d+\s*$")
+
+# Comma-separated alternatives are matched in a single in-browser query, so a
+# missing element costs one timeout instead of one per fallback selector.
+_MONACO_SELECTOR = (
+    ".monaco-editor, [data-uri*='monaco'], .monaco-editor-background, "
+    ".monaco-editor .monaco-scrollable-element"
+)
+_EDITOR_CONTENT_SELECTOR = (
+    ".monaco-editor, .monaco-editor .view-lines, "
+    ".monaco-editor .monaco-editor-background"
+)
+_RESET_BUTTON_SELECTOR = (
+    "button:has-text('Reset to Example'), "
+    "button[type='button']:has-text('Reset'), "
+    "[role='button']:has-text('Reset to Example')"
+)
+_COUNTER_SELECTOR = "text=/Content length: \\d+ characters/"
+_EDITOR_TEXTAREA_SELECTOR = ".monaco-editor textarea"
+_SYNTAX_SELECTOR = (
+    ".monaco-editor .mtk1, .monaco-editor .mtk2, .monaco-editor .mtk3, "
+    ".monaco-editor .mtk4, .monaco-editor .view-lines .view-line, "
+    ".monaco-editor [class*='mtk']"
+)
+_LINE_NUMBERS_SELECTOR = (
+    ".monaco-editor .line-numbers, .monaco-editor .margin .line-numbers, "
+    ".monaco-editor [class*='line-numbers']"
+)
+_DARK_THEME_SELECTOR = (
+    ".monaco-editor.vs-dark, .monaco-editor[data-theme='vs-dark'], "
+    ".monaco-editor[class*='dark']"
+)
+
+# Reads the full document from the Monaco model. The rendered view lines are
+# virtualized and the textarea only mirrors the text around the cursor, so the
+# DOM is only a fallback for when the Monaco API is not exposed on window.
+_EDITOR_VALUE_JS = """() => window.monaco?.editor?.getModels()?.[0]?.getValue()
+    ?? document.querySelector('.monaco-editor')?.textContent
+    ?? ''"""
+
+_EDITOR_CONTAINS_JS = f"sub => ({_EDITOR_VALUE_JS})().includes(sub)"
+_EDITOR_CONTAINS_ALL_JS = (
+    f"items => {{ const v = ({_EDITOR_VALUE_JS})(); "
+    "return items.every(i => v.includes(i)); }"
+)
+
+# Filters the page text in the browser so only a few candidate lines are sent
+# back over CDP.
+_COUNTER_MENTIONS_JS = """() => document.body.innerText
+    .split('\\n')
+    .filter(line => /content|length|character/i.test(line))
+    .slice(0, 3)"""
+
+# True when every RGB channel of the element's background is below 128.
+_IS_DARK_BACKGROUND_JS = """el => {
+    const channels = getComputedStyle(el).backgroundColor.match(/\\d+/g);
+    return channels !== null && channels.slice(0, 3).every(c => Number(c) < 128);
+}"""
+
+# The counter exposes its value as a data attribute, so reading it needs no
+# text matching. Throws if the counter is missing.
+_READ_COUNTER_JS = (
+    "() => Number(document.getElementById('content-length-counter').dataset.length)"
+)
+
+# True when focus sits on a page element that no earlier call has seen, so
+# consecutive calls confirm that each Tab press moves focus somewhere new.
+_FOCUS_MOVED_JS = """() => {
+    const el = document.activeElement;
+    const seen = (window.__tabFocusSeen ??= new Set());
+    if (!el || el === document.body || seen.has(el)) return false;
+    seen.add(el);
+    return true;
+}"""
+
+# True once the counter's value lies within [low, high].
+_COUNTER_BETWEEN_JS = """([low, high]) => {
+    const n = Number(document.getElementById('content-length-counter')?.dataset.length);
+    return n >= low && n <= high;
+}"""
+
+_NONZERO_COUNTER_RE = re.compile(r"Content length: [1-9]\d* characters")
+
+# Replaces the whole document in one round trip. Falls back to inserting over
+# the current selection through the textarea when the Monaco API is not exposed.
+_SET_EDITOR_VALUE_JS = """text => {
+    performance.mark('editor-content-set');
+    const editor = window.monaco?.editor?.getEditors?.()[0];
+    if (editor) {
+        editor.setValue(text);
+    } else {
+        document.execCommand('insertText', false, text);
+    }
+}"""
+
+# Appends text at the end of the document as a single edit. Falls back to
+# inserting at the cursor through the textarea when the Monaco API is not exposed.
+_APPEND_EDITOR_TEXT_JS = """text => {
+    const editor = window.monaco?.editor?.getEditors?.()[0];
+    if (editor) {
+        const end = editor.getModel().getFullModelRange().getEndPosition();
+        const range = window.monaco.Range.fromPositions(end);
+        editor.executeEdits('e2e', [{range, text}]);
+    } else {
+        document.execCommand('insertText', false, text);
+    }
+}"""
+
+# Clicks "Reset to Example" the given number of times within a single task,
+# closer together than separate Playwright clicks can be.
+_RESET_CLICK_BURST_JS = """times => {
+    const button = [...document.querySelectorAll('button')]
+        .find(b => b.textContent.includes('Reset to Example'));
+    for (let i = 0; i < times; i++) {
+        button.click();
+    }
+}"""
+
+# Milliseconds since the last _set_editor_content call started, measured in the
+# browser so Playwright's own round trips are not counted.
+_MS_SINCE_CONTENT_SET_JS = (
+    "() => performance.measure('editor-content-update', 'editor-content-set').duration"
+)
+
+# Resolves after two animation frames: one to render and one for layout to settle.
+_SETTLE_FRAMES_JS = (
+    "() => new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)))"
+)
+
+
+async def _wait_for_editor_content(
+    page: Page, substring: str, timeout: int = 3000
+) -> None:
+    """Wait in the browser until the editor content contains ``substring``."""
+    await page.wait_for_function(_EDITOR_CONTAINS_JS, arg=substring, timeout=timeout)
+
+
+async def _expect_counter(
+    page: Page, length: int, tolerance: int = 0, timeout: int = 5000
+) -> None:
+    """Wait until the character counter shows ``length`` give or take ``tolerance``."""
+    lengths = "|".join(
+        str(n) for n in range(max(0, length - tolerance), length + tolerance + 1)
+    )
+    await expect(page.locator(_COUNTER_SELECTOR).first).to_have_text(
+        re.compile(rf"Content length: (?:{lengths}) characters"), timeout=timeout
+    )
+
+
+async def _wait_for_counter_between(
+    page: Page, low: int, high: int, timeout: int = 5000
+) -> int:
+    """Wait until the character counter is within [low, high] and return it."""
+    await page.wait_for_function(_COUNTER_BETWEEN_JS, arg=[low, high], timeout=timeout)
+    return await _read_counter(page)
+
+
+async def _set_editor_content(page: Page, text: str) -> None:
+    """Replace the editor content without dispatching a key event per character.
+
+    Only for seeding content; tests of the input pipeline itself should keep
+    typing through the keyboard.
+    """
+    # Focus and select everything so the insertText fallback replaces it all
+    await page.locator(_EDITOR_TEXTAREA_SELECTOR).first.click()
+    await page.keyboard.press("Control+a")
+    await page.evaluate(_SET_EDITOR_VALUE_JS, text)
+
+
+async def _reset_editor(page: Page) -> None:
+    """Click "Reset to Example" and wait for the default content to load."""
+    await page.locator("button", has_text="Reset to Example").click()
+    await _wait_for_editor_content(page, "example-connector")
+
+
+async def _read_counter(page: Page) -> int:
+    """Return the number currently shown by the character counter."""
+    return await page.evaluate(_READ_COUNTER_JS)
+
+
+async def _editor_value(page: Page) -> str:
+    """Return the full editor content in a single round trip."""
+    return await page.evaluate(_EDITOR_VALUE_JS)
+
+
+async def _set_viewport_size(page: Page, width: int, height: int) -> None:
+    """Resize the viewport and wait for the page to render at the new size."""
+    await page.set_viewport_size({"width": width, "height": height})
+    await page.evaluate(_SETTLE_FRAMES_JS)
+
 
 class TestYamlEditorBasicFunctionality:
     """Test basic YAML editor functionality."""
 
-    async def _wait_for_monaco_editor_ready(
-        self, page: Page, timeout: int = 15000
-    ) -> None:
-        """Enhanced wait for Monaco editor to be fully loaded and ready."""
-        try:
-            # Wait for Monaco editor container
-            await page.wait_for_selector(".monaco-editor", timeout=timeout)
-
-            # Wait for Monaco editor to be fully initialized
-            await page.wait_for_selector(
-                ".monaco-editor .monaco-editor-background", timeout=5000
-            )
-
-            # Wait for textarea to be present (indicates editor is interactive)
-            await page.wait_for_selector(".monaco-editor textarea", timeout=5000)
-
-            # Additional wait for editor to be fully rendered
-            await page.wait_for_function(
-                "() => document.querySelector('.monaco-editor textarea') !== null && "
-                "document.querySelector('.monaco-editor .monaco-editor-background') !== null",
-                timeout=3000,
-            )
-
-        except PlaywrightTimeoutError as e:
-            # Enhanced error context for debugging
-            console_logs = []
-
-            # Collect any console errors
-            page.on(
-                "console", lambda msg: console_logs.append(f"{msg.type}: {msg.text}")
-            )
-
-            raise AssertionError(
-                f"Monaco editor failed to load within {timeout}ms. "
-                f"Error: {str(e)}. "
-                f"Page title: {await page.title()}. "
-                f"Console logs: {console_logs[-5:] if console_logs else 'None'}. "
-                f"Monaco elements found: {await page.locator('.monaco-editor').count()}"
-            ) from e
-
     @pytest.mark.e2e
     @pytest.mark.browser
     async def test_page_loads_successfully(self, app_page: Page):
@@ -78,7 +232,9 @@ class TestYamlEditorBasicFunctionality:
 
     @pytest.mark.e2e
     @pytest.mark.browser
-    async def test_yaml_editor_is_present(self, app_page: Page):
+    async def test_yaml_editor_is_present(
+        self, app_page: Page, monaco_ready: ElementHandle
+    ):
         """Test that the YAML editor component is present with enhanced selectors."""
         try:
             # More specific selector for YAML editor heading
@@ -87,25 +243,11 @@ class TestYamlEditorBasicFunctionality:
             )
             await expect(editor_heading).to_be_visible(timeout=8000)
 
-            # Enhanced Monaco editor detection with multiple fallback selectors
-            monaco_selectors = [
-                ".monaco-editor",
-                "[data-uri*='monaco']",
-                ".monaco-editor-background",
-                ".monaco-editor .monaco-scrollable-element",
-            ]
-
-            editor_found = False
-            for selector in monaco_selectors:
-                try:
-                    editor_element = app_page.locator(selector).first()
-                    await expect(editor_element).to_be_visible(timeout=3000)
-                    editor_found = True
-                    break
-                except PlaywrightTimeoutError:
-                    continue
-
-            if not editor_found:
+            # Enhanced Monaco editor detection with fallback selectors
+            try:
+                editor_element = app_page.locator(_MONACO_SELECTOR).first
+                await expect(editor_element).to_be_visible(timeout=3000)
+            except AssertionError as e:
                 # Collect diagnostic information
                 all_divs = await app_page.locator("div").count()
                 monaco_count = await app_page.locator(".monaco-editor").count()
@@ -113,11 +255,8 @@ class TestYamlEditorBasicFunctionality:
                 raise AssertionError(
                     f"Monaco editor not found. Total divs: {all_divs}, "
                     f"Monaco elements: {monaco_count}. "
-                    f"Tried selectors: {monaco_selectors}"
-                )
-
-            # Wait for editor to be fully ready
-            await self._wait_for_monaco_editor_ready(app_page)
+                    f"Tried selector: {_MONACO_SELECTOR}"
+                ) from e
 
         except Exception as e:
             # Enhanced error context
@@ -132,49 +271,30 @@ class TestYamlEditorBasicFunctionality:
     async def test_reset_button_is_present(self, app_page: Page):
         """Test that the reset button is present and clickable with enhanced selectors."""
         try:
-            # More specific button selector with multiple approaches
-            reset_button_selectors = [
-                "button:has-text('Reset to Example')",
-                "button[type='button']:has-text('Reset')",
-                "[role='button']:has-text('Reset to Example')",
-            ]
-
-            reset_button = None
-            for selector in reset_button_selectors:
-                try:
-                    button = app_page.locator(selector).first()
-                    await expect(button).to_be_visible(timeout=3000)
-                    reset_button = button
-                    break
-                except PlaywrightTimeoutError:
-                    continue
-
-            if reset_button is None:
+            # Button selector covering several approaches
+            reset_button = app_page.locator(_RESET_BUTTON_SELECTOR).first
+            try:
+                await expect(reset_button).to_be_visible(timeout=3000)
+            except AssertionError:
                 # Collect all buttons for debugging
                 all_buttons = await app_page.locator("button").all()
-                button_texts = []
-                for btn in all_buttons:
-                    try:
-                        text = await btn.text_content()
-                        button_texts.append(text)
-                    except Exception:
-                        button_texts.append("(text unavailable)")
+                results = await asyncio.gather(
+                    *(btn.text_content() for btn in all_buttons),
+                    return_exceptions=True,
+                )
+                button_texts = [
+                    "(text unavailable)" if isinstance(text, Exception) else text
+                    for text in results
+                ]
 
                 raise AssertionError(
                     f"Reset button not found. Available buttons: {button_texts}. "
-                    f"Tried selectors: {reset_button_selectors}"
-                )
+                    f"Tried selector: {_RESET_BUTTON_SELECTOR}"
+                ) from None
 
-            # Enhanced button state verification
+            # Visibility already implies a non-empty bounding box
             await expect(reset_button).to_be_enabled(timeout=5000)
 
-            # Verify button is interactive (not just visible)
-            button_box = await reset_button.bounding_box()
-            assert button_box is not None, "Reset button should have valid bounding box"
-            assert button_box["width"] > 0 and button_box["height"] > 0, (
-                "Reset button should have positive dimensions"
-            )
-
         except Exception as e:
             raise AssertionError(f"Reset button test failed: {str(e)}") from e
 
@@ -183,57 +303,22 @@ class TestYamlEditorBasicFunctionality:
     async def test_character_counter_is_present(self, app_page: Page):
         """Test that the character counter is present with enhanced pattern matching."""
         try:
-            # Enhanced counter selector with multiple patterns
-            counter_patterns = [
-                "text=/Content length: \\d+ characters/",
-                ":has-text('Content length:')",
-                "text=/\\d+ characters/",
-                "[data-testid*='counter']",  # In case data-testid is added later
-            ]
-
-            counter_found = False
-            counter_element = None
-
-            for pattern in counter_patterns:
-                try:
-                    counter = app_page.locator(pattern).first()
-                    await expect(counter).to_be_visible(timeout=3000)
-                    counter_element = counter
-                    counter_found = True
-                    break
-                except PlaywrightTimeoutError:
-                    continue
-
-            if not counter_found:
+            # Counter text matched by a single pattern
+            counter_element = app_page.locator(_COUNTER_SELECTOR).first
+            try:
+                await expect(counter_element).to_be_visible(timeout=3000)
+            except AssertionError:
                 # Enhanced debugging information
-                page_text = await app_page.locator("body").inner_text()
-                content_length_mentions = [
-                    line
-                    for line in page_text.split("\n")
-                    if "content" in line.lower()
-                    or "length" in line.lower()
-                    or "character" in line.lower()
-                ]
+                content_length_mentions = await app_page.evaluate(_COUNTER_MENTIONS_JS)
 
                 raise AssertionError(
                     f"Character counter not found. "
-                    f"Tried patterns: {counter_patterns}. "
-                    f"Potential matches in page: {content_length_mentions[:3]}"
-                )
-
-            # Verify counter shows valid content
-            if counter_element is not None:
-                counter_text = await counter_element.text_content()
-                assert counter_text is not None, "Counter should have text content"
-                assert len(counter_text.strip()) > 0, "Counter text should not be empty"
+                    f"Tried selector: {_COUNTER_SELECTOR}. "
+                    f"Potential matches in page: {content_length_mentions}"
+                ) from None
 
-            # Verify counter format is reasonable
-            import re
-
-            if not re.search(r"\d+", counter_text):
-                raise AssertionError(
-                    f"Counter should contain numbers, got: '{counter_text}'"
-                )
+            # Verify counter shows a number in the expected format
+            await expect(counter_element).to_have_text(_COUNTER_RE)
 
         except Exception as e:
             raise AssertionError(f"Character counter test failed: {str(e)}") from e
@@ -242,134 +327,49 @@ class TestYamlEditorBasicFunctionality:
 class TestYamlEditorInteraction:
     """Test YAML editor interaction functionality."""
 
-    async def _wait_for_monaco_editor_ready(
-        self, page: Page, timeout: int = 15000
-    ) -> None:
-        """Enhanced wait for Monaco editor to be fully loaded and ready."""
-        try:
-            # Wait for Monaco editor container
-            await page.wait_for_selector(".monaco-editor", timeout=timeout)
-
-            # Wait for Monaco editor to be fully initialized
-            await page.wait_for_selector(
-                ".monaco-editor .monaco-editor-background", timeout=5000
-            )
-
-            # Wait for textarea to be present (indicates editor is interactive)
-            await page.wait_for_selector(".monaco-editor textarea", timeout=5000)
-
-            # Additional wait for editor to be fully rendered
-            await page.wait_for_function(
-                "() => document.querySelector('.monaco-editor textarea') !== null && "
-                "document.querySelector('.monaco-editor .monaco-editor-background') !== null",
-                timeout=3000,
-            )
-
-        except PlaywrightTimeoutError as e:
-            # Enhanced error context for debugging
-            console_logs = []
-
-            # Collect any console errors
-            page.on(
-                "console", lambda msg: console_logs.append(f"{msg.type}: {msg.text}")
-            )
-
-            raise AssertionError(
-                f"Monaco editor failed to load within {timeout}ms. "
-                f"Error: {str(e)}. "
-                f"Page title: {await page.title()}. "
-                f"Console logs: {console_logs[-5:] if console_logs else 'None'}. "
-                f"Monaco elements found: {await page.locator('.monaco-editor').count()}"
-            ) from e
-
     @pytest.mark.e2e
     @pytest.mark.browser
-    async def test_editor_contains_default_content(self, app_page: Page):
+    async def test_editor_contains_default_content(
+        self, app_page: Page, monaco_ready: ElementHandle
+    ):
         """Test that the editor contains default YAML content with enhanced validation."""
         try:
-            # Enhanced Monaco editor wait
-            await self._wait_for_monaco_editor_ready(app_page)
-
-            # More specific content validation with multiple approaches
-            editor_selectors = [
-                ".monaco-editor",
-                ".monaco-editor .monaco-editor-background",
-                ".monaco-editor .view-lines",
-            ]
-
-            content_found = False
+            # Check every expected item in one browser-side predicate
             expected_content_items = ["example-connector", "version", "description"]
+            editor_element = app_page.locator(_EDITOR_CONTENT_SELECTOR).first
 
-            for selector in editor_selectors:
-                try:
-                    editor_element = app_page.locator(selector).first()
-                    await expect(editor_element).to_be_visible(timeout=3000)
-
-                    # Check for expected content items
-                    for content_item in expected_content_items:
-                        try:
-                            await expect(editor_element).to_contain_text(
-                                content_item, timeout=2000
-                            )
-                            content_found = True
-                        except PlaywrightTimeoutError:
-                            continue
-
-                    if content_found:
-                        break
-
-                except PlaywrightTimeoutError:
-                    continue
-
-            if not content_found:
+            try:
+                await expect(editor_element).to_be_visible(timeout=3000)
+                await app_page.wait_for_function(
+                    _EDITOR_CONTAINS_ALL_JS, arg=expected_content_items, timeout=3000
+                )
+            except (AssertionError, PlaywrightTimeoutError) as e:
                 # Enhanced debugging - get actual editor content
-                try:
-                    # Try to get content via textarea
-                    textarea = app_page.locator(".monaco-editor textarea").first()
-                    actual_content = await textarea.input_value()
-                except Exception:
-                    # Fallback to text content
-                    actual_content = (
-                        await app_page.locator(".monaco-editor").first().text_content()
-                    )
+                actual_content = await _editor_value(app_page)
 
                 raise AssertionError(
                     f"Default content not found in editor. "
                     f"Expected items: {expected_content_items}. "
                     f"Actual content preview: '{actual_content[:200] if actual_content else 'None'}...'"
-                )
+                ) from e
 
         except Exception as e:
             raise AssertionError(f"Default content test failed: {str(e)}") from e
 
     @pytest.mark.e2e
     @pytest.mark.browser
-    async def test_reset_button_functionality(self, app_page: Page):
+    async def test_reset_button_functionality(
+        self, app_page: Page, monaco_ready: ElementHandle
+    ):
         """Test that the reset button works correctly with enhanced validation."""
         try:
-            # Enhanced Monaco editor wait
-            await self._wait_for_monaco_editor_ready(app_page)
-
-            # More specific reset button selector with fallbacks
-            reset_button_selectors = [
-                "button:has-text('Reset to Example')",
-                "button[type='button']:has-text('Reset')",
-                "[role='button']:has-text('Reset to Example')",
-            ]
-
-            reset_button = None
-            for selector in reset_button_selectors:
-                try:
-                    button = app_page.locator(selector).first()
-                    await expect(button).to_be_visible(timeout=3000)
-                    await expect(button).to_be_enabled(timeout=2000)
-                    reset_button = button
-                    break
-                except PlaywrightTimeoutError:
-                    continue
-
-            if reset_button is None:
-                raise AssertionError("Reset button not found or not enabled")
+            # Reset button selector with fallbacks
+            reset_button = app_page.locator(_RESET_BUTTON_SELECTOR).first
+            try:
+                await expect(reset_button).to_be_visible(timeout=3000)
+                await expect(reset_button).to_be_enabled(timeout=2000)
+            except AssertionError as e:
+                raise AssertionError("Reset button not found or not enabled") from e
 
             # Get initial state for comparison (not used but kept for potential debugging)
 
@@ -379,57 +379,19 @@ class TestYamlEditorInteraction:
             except PlaywrightTimeoutError as e:
                 raise AssertionError(f"Reset button click failed: {str(e)}") from e
 
-            # Enhanced wait for reset to take effect
-            await asyncio.sleep(0.5)  # Initial wait
-
-            # Wait for content to actually change (if it was different before)
-            max_wait_attempts = 10
-            for _attempt in range(max_wait_attempts):
-                try:
-                    current_content = (
-                        await app_page.locator(".monaco-editor textarea")
-                        .first()
-                        .input_value()
-                    )
-                except Exception:
-                    current_content = (
-                        await app_page.locator(".monaco-editor").first().text_content()
-                    )
-
-                # Check if content contains expected default items
-                if current_content and "example-connector" in current_content:
-                    break
-
-                await asyncio.sleep(0.2)
-            else:
+            # Wait for the reset content to show up in the editor
+            try:
+                await _wait_for_editor_content(app_page, "example-connector")
+            except PlaywrightTimeoutError as e:
                 raise AssertionError(
-                    f"Reset did not restore expected content after {max_wait_attempts} attempts. "
-                    f"Current content: '{current_content[:100] if current_content else 'None'}...'"
-                )
-
-            # Verify that the default content is present with multiple validation approaches
-            editor_content_selectors = [
-                ".monaco-editor",
-                ".monaco-editor .view-lines",
-                ".monaco-editor .monaco-editor-background",
-            ]
+                    f"Reset did not restore expected content: {str(e)}"
+                ) from e
 
-            content_verified = False
-            for selector in editor_content_selectors:
-                try:
-                    editor_element = app_page.locator(selector).first()
-                    await expect(editor_element).to_contain_text(
-                        "example-connector", timeout=3000
-                    )
-                    content_verified = True
-                    break
-                except PlaywrightTimeoutError:
-                    continue
-
-            if not content_verified:
-                raise AssertionError(
-                    "Reset button did not restore expected default content"
-                )
+            # Verify that the default content is present in the editor
+            content = await _editor_value(app_page)
+            assert "example-connector" in content, (
+                "Reset button did not restore expected default content"
+            )
 
         except Exception as e:
             raise AssertionError(
@@ -438,107 +400,44 @@ class TestYamlEditorInteraction:
 
     @pytest.mark.e2e
     @pytest.mark.browser
-    async def test_character_counter_updates(self, app_page: Page):
+    async def test_character_counter_updates(
+        self, app_page: Page, monaco_ready: ElementHandle
+    ):
         """Test that the character counter updates when content changes with enhanced validation."""
         try:
-            # Enhanced Monaco editor wait
-            await self._wait_for_monaco_editor_ready(app_page)
-
-            # Enhanced counter selector with multiple patterns
-            counter_selectors = [
-                "text=/Content length: \\d+ characters/",
-                ":has-text('Content length:')",
-                "text=/\\d+ characters/",
-            ]
-
-            counter_element = None
-            for selector in counter_selectors:
-                try:
-                    counter = app_page.locator(selector).first()
-                    await expect(counter).to_be_visible(timeout=3000)
-                    counter_element = counter
-                    break
-                except PlaywrightTimeoutError:
-                    continue
-
-            if counter_element is None:
-                raise AssertionError(
-                    f"Character counter not found. Tried selectors: {counter_selectors}"
-                )
-
-            # Get initial character count with enhanced parsing
-            initial_text = await counter_element.text_content()
-            import re
-
-            initial_match = re.search(r"(\d+)", initial_text or "")
-            if not initial_match:
+            # Counter text matched by a single pattern
+            counter_element = app_page.locator(_COUNTER_SELECTOR).first
+            try:
+                await expect(counter_element).to_be_visible(timeout=3000)
+            except AssertionError as e:
                 raise AssertionError(
-                    f"Could not parse initial character count from: '{initial_text}'"
-                )
+                    f"Character counter not found. Tried selector: {_COUNTER_SELECTOR}"
+                ) from e
 
-            # Store initial count for potential debugging
-            _initial_count = int(initial_match.group(1))
+            # Get initial character count for the failure message below
+            initial_count = await _read_counter(app_page)
 
             # Enhanced reset button interaction
-            reset_button_selectors = [
-                "button:has-text('Reset to Example')",
-                "button[type='button']:has-text('Reset')",
-            ]
-
-            reset_button = None
-            for selector in reset_button_selectors:
-                try:
-                    button = app_page.locator(selector).first()
-                    await expect(button).to_be_enabled(timeout=3000)
-                    reset_button = button
-                    break
-                except PlaywrightTimeoutError:
-                    continue
-
-            if reset_button is None:
-                raise AssertionError("Reset button not found for counter test")
+            reset_button = app_page.locator(_RESET_BUTTON_SELECTOR).first
+            try:
+                await expect(reset_button).to_be_enabled(timeout=3000)
+            except AssertionError as e:
+                raise AssertionError("Reset button not found for counter test") from e
 
             # Click reset and wait for counter update
             await reset_button.click(timeout=5000)
 
-            # Enhanced wait for counter update with retry logic
-            max_attempts = 15
-            counter_updated = False
-
-            for _attempt in range(max_attempts):
-                await asyncio.sleep(0.2)
-
-                try:
-                    current_text = await counter_element.text_content()
-                    current_match = re.search(r"(\d+)", current_text or "")
-
-                    if current_match:
-                        current_count = int(current_match.group(1))
-
-                        # Verify counter shows reasonable content length
-                        if current_count > 0:
-                            counter_updated = True
-                            break
-
-                except Exception:
-                    continue
-
-            if not counter_updated:
-                final_text = await counter_element.text_content()
-                raise AssertionError(
-                    f"Character counter did not update properly after {max_attempts} attempts. "
-                    f"Initial: '{initial_text}', Final: '{final_text}'"
+            # Wait for the counter to show a non-zero length for the default content
+            try:
+                await expect(counter_element).to_have_text(
+                    _NONZERO_COUNTER_RE, timeout=3000
                 )
-
-            # Final validation
-            await expect(counter_element).to_contain_text(
-                "Content length:", timeout=3000
-            )
-
-            final_counter_text = await counter_element.text_content()
-            assert "0 characters" not in final_counter_text, (
-                f"Counter should show non-zero characters for default content, got: '{final_counter_text}'"
-            )
+            except AssertionError as e:
+                final_count = await _read_counter(app_page)
+                raise AssertionError(
+                    f"Character counter did not update properly: {str(e)}. "
+                    f"Initial: {initial_count}, Final: {final_count}"
+                ) from e
 
         except Exception as e:
             raise AssertionError(
@@ -549,167 +448,89 @@ class TestYamlEditorInteraction:
 class TestYamlEditorAdvanced:
     """Test advanced YAML editor functionality."""
 
-    async def _wait_for_monaco_editor_ready(
-        self, page: Page, timeout: int = 15000
-    ) -> None:
-        """Enhanced wait for Monaco editor to be fully loaded and ready."""
-        try:
-            await page.wait_for_selector(".monaco-editor", timeout=timeout)
-            await page.wait_for_selector(
-                ".monaco-editor .monaco-editor-background", timeout=5000
-            )
-            await page.wait_for_selector(".monaco-editor textarea", timeout=5000)
-            await page.wait_for_function(
-                "() => document.querySelector('.monaco-editor textarea') !== null && "
-                "document.querySelector('.monaco-editor .monaco-editor-background') !== null",
-                timeout=3000,
-            )
-        except PlaywrightTimeoutError as e:
-            console_logs = []
-            page.on(
-                "console", lambda msg: console_logs.append(f"{msg.type}: {msg.text}")
-            )
-            raise AssertionError(
-                f"Monaco editor failed to load within {timeout}ms. Error: {str(e)}. "
-                f"Console logs: {console_logs[-3:] if console_logs else 'None'}"
-            ) from e
-
     @pytest.mark.e2e
     @pytest.mark.browser
     @pytest.mark.slow_e2e
-    async def test_editor_syntax_highlighting(self, app_page: Page):
+    async def test_editor_syntax_highlighting(
+        self, app_page: Page, monaco_ready: ElementHandle
+    ):
         """Test that the YAML editor has proper syntax highlighting with enhanced detection."""
         try:
-            await self._wait_for_monaco_editor_ready(app_page)
-
-            # Multiple selectors for syntax highlighting detection
-            syntax_selectors = [
-                ".monaco-editor .mtk1, .monaco-editor .mtk2, .monaco-editor .mtk3, .monaco-editor .mtk4",
-                ".monaco-editor .view-lines .view-line",
-                ".monaco-editor [class*='mtk']",
-            ]
-
-            syntax_found = False
-            for selector in syntax_selectors:
-                try:
-                    syntax_elements = app_page.locator(selector)
-                    if await syntax_elements.count() > 0:
-                        await expect(syntax_elements.first()).to_be_visible(
-                            timeout=3000
-                        )
-                        syntax_found = True
-                        break
-                except PlaywrightTimeoutError:
-                    continue
-
-            if not syntax_found:
-                all_monaco_elements = await app_page.locator(".monaco-editor *").count()
+            # Any token or rendered line counts as syntax highlighting
+            try:
+                await app_page.wait_for_function(
+                    "sel => document.querySelectorAll(sel).length > 0",
+                    arg=_SYNTAX_SELECTOR,
+                    timeout=3000,
+                )
+            except PlaywrightTimeoutError as e:
+                all_monaco_elements = await app_page.evaluate(
+                    "() => document.querySelectorAll('.monaco-editor *').length"
+                )
                 raise AssertionError(
                     f"Syntax highlighting elements not found. "
                     f"Total Monaco elements: {all_monaco_elements}. "
-                    f"Tried selectors: {syntax_selectors}"
-                )
+                    f"Tried selector: {_SYNTAX_SELECTOR}"
+                ) from e
 
         except Exception as e:
             raise AssertionError(f"Syntax highlighting test failed: {str(e)}") from e
 
     @pytest.mark.e2e
     @pytest.mark.browser
-    async def test_editor_line_numbers(self, app_page: Page):
+    async def test_editor_line_numbers(
+        self, app_page: Page, monaco_ready: ElementHandle
+    ):
         """Test that the editor shows line numbers with enhanced detection."""
         try:
-            await self._wait_for_monaco_editor_ready(app_page)
-
-            # Multiple selectors for line numbers
-            line_number_selectors = [
-                ".monaco-editor .line-numbers",
-                ".monaco-editor .margin .line-numbers",
-                ".monaco-editor [class*='line-numbers']",
-            ]
-
-            line_numbers_found = False
-            for selector in line_number_selectors:
-                try:
-                    line_numbers = app_page.locator(selector)
-                    if await line_numbers.count() > 0:
-                        first_line = line_numbers.first()
-                        await expect(first_line).to_be_visible(timeout=3000)
-
-                        # Verify it contains actual line numbers
-                        line_text = await first_line.text_content()
-                        if line_text and line_text.strip().isdigit():
-                            line_numbers_found = True
-                            break
-                except PlaywrightTimeoutError:
-                    continue
-
-            if not line_numbers_found:
+            # The first line number element should show an actual number
+            first_line = app_page.locator(_LINE_NUMBERS_SELECTOR).first
+            try:
+                await expect(first_line).to_be_visible(timeout=3000)
+                await expect(first_line).to_have_text(_LINE_NUMBER_RE)
+            except AssertionError as e:
                 editor_margin = await app_page.locator(".monaco-editor .margin").count()
                 raise AssertionError(
                     f"Line numbers not found. Editor margin elements: {editor_margin}. "
-                    f"Tried selectors: {line_number_selectors}"
-                )
+                    f"Tried selector: {_LINE_NUMBERS_SELECTOR}"
+                ) from e
 
         except Exception as e:
             raise AssertionError(f"Line numbers test failed: {str(e)}") from e
 
     @pytest.mark.e2e
     @pytest.mark.browser
-    async def test_editor_dark_theme(self, app_page: Page):
+    async def test_editor_dark_theme(self, app_page: Page, monaco_ready: ElementHandle):
         """Test that the editor uses dark theme with enhanced detection."""
         try:
-            await self._wait_for_monaco_editor_ready(app_page)
-
-            # Multiple approaches for dark theme detection
-            dark_theme_selectors = [
-                ".monaco-editor.vs-dark",
-                ".monaco-editor[data-theme='vs-dark']",
-                ".monaco-editor[class*='dark']",
-            ]
-
-            theme_found = False
-            for selector in dark_theme_selectors:
-                try:
-                    theme_element = app_page.locator(selector).first()
-                    await expect(theme_element).to_be_visible(timeout=3000)
-                    theme_found = True
-                    break
-                except PlaywrightTimeoutError:
-                    continue
+            # Dark theme detection across class and attribute markers
+            theme_found = True
+            try:
+                await expect(
+                    app_page.locator(_DARK_THEME_SELECTOR).first
+                ).to_be_visible(timeout=3000)
+            except AssertionError:
+                theme_found = False
 
             # Fallback: check background color
             if not theme_found:
                 try:
                     editor_bg = app_page.locator(
                         ".monaco-editor .monaco-editor-background"
-                    ).first()
+                    ).first
                     await expect(editor_bg).to_be_visible(timeout=3000)
 
-                    bg_color = await editor_bg.evaluate(
-                        "el => window.getComputedStyle(el).backgroundColor"
-                    )
-                    if bg_color:
-                        import re
-
-                        rgb_match = re.search(
-                            r"rgb\((\d+),\s*(\d+),\s*(\d+)\)", bg_color
-                        )
-                        if rgb_match:
-                            r, g, b = map(int, rgb_match.groups())
-                            if r < 128 and g < 128 and b < 128:  # Dark background
-                                theme_found = True
+                    theme_found = await editor_bg.evaluate(_IS_DARK_BACKGROUND_JS)
                 except Exception:
                     pass
 
             if not theme_found:
-                editor_classes = (
-                    await app_page.locator(".monaco-editor")
-                    .first()
-                    .get_attribute("class")
-                )
+                editor_classes = await app_page.locator(
+                    ".monaco-editor"
+                ).first.get_attribute("class")
                 raise AssertionError(
                     f"Dark theme not detected. Editor classes: '{editor_classes}'. "
-                    f"Tried selectors: {dark_theme_selectors}"
+                    f"Tried selector: {_DARK_THEME_SELECTOR}"
                 )
 
         except Exception as e:
@@ -721,43 +542,49 @@ class TestYamlEditorResponsiveness:
 
     @pytest.mark.e2e
     @pytest.mark.browser
-    async def test_editor_responsive_layout(self, app_page: Page):
-        """Test that the editor layout is responsive."""
-        # Wait for the Monaco editor to load
-        await app_page.wait_for_selector(".monaco-editor", timeout=10000)
-
-        # Test desktop viewport (default is 1280x720)
-        editor = app_page.locator(".monaco-editor")
-        await expect(editor).to_be_visible()
-
-        # Change to tablet viewport
-        await app_page.set_viewport_size({"width": 768, "height": 1024})
-        await app_page.wait_for_timeout(500)
-        await expect(editor).to_be_visible()
-
-        # Change to mobile viewport
-        await app_page.set_viewport_size({"width": 375, "height": 667})
-        await app_page.wait_for_timeout(500)
-        await expect(editor).to_be_visible()
+    @pytest.mark.parametrize(
+        ("width", "height"),
+        [
+            pytest.param(1280, 720, id="desktop"),
+            pytest.param(768, 1024, id="tablet"),
+            pytest.param(375, 667, id="mobile"),
+        ],
+    )
+    async def test_editor_responsive_layout(
+        self,
+        isolated_context: BrowserContext,
+        base_url: str,
+        width: int,
+        height: int,
+    ):
+        """Test that the editor is visible at desktop, tablet, and mobile sizes."""
+        # Use a separate page so the resize does not leak into the shared one,
+        # and size the viewport before loading so the page renders at that size
+        page = await isolated_context.new_page()
+        await _set_viewport_size(page, width, height)
+        await page.goto(base_url, wait_until="domcontentloaded")
+
+        editor = page.locator(".monaco-editor")
+        await expect(editor).to_be_visible(timeout=10000)
 
     @pytest.mark.e2e
     @pytest.mark.browser
-    async def test_page_layout_structure(self, app_page: Page):
+    async def test_page_layout_structure(self, app_page_fast: Page):
         """Test the overall page layout structure."""
         # Check main container
-        container = app_page.locator("div").first()
+        container = app_page_fast.locator("div").first
         await expect(container).to_be_visible()
 
         # Check that all main elements are present
-        heading = app_page.locator("h1")
+        heading = app_page_fast.locator("h1")
         await expect(heading).to_be_visible()
 
-        description = app_page.locator(
+        description = app_page_fast.locator(
             "text=Build and configure data connectors using YAML"
         )
         await expect(description).to_be_visible()
 
-        editor_section = app_page.locator(
+        editor_section = app_page_fast.locator(
             "h2", has_text="YAML Connector Configuration Editor"
         )
         await expect(editor_section).to_be_visible()
@@ -768,39 +595,43 @@ class TestYamlEditorErrorHandling:
 
     @pytest.mark.e2e
     @pytest.mark.browser
-    async def test_editor_loads_with_network_delays(self, app_page: Page):
+    async def test_editor_loads_with_network_delays(
+        self, isolated_context: BrowserContext, base_url: str
+    ):
         """Test that the editor loads properly even with network delays."""
-        # Simulate slow network
-        await app_page.route("**/*", lambda route: route.continue_())
+        # Simulate slow network on a separate context, so the route does not
+        # stay installed on the shared page for the rest of the module
+        await isolated_context.route("**/*", lambda route: route.continue_())
+        page = await isolated_context.new_page()
+        await page.goto(base_url, wait_until="domcontentloaded")
 
         # Wait for the Monaco editor to load with extended timeout
-        await app_page.wait_for_selector(".monaco-editor", timeout=15000)
+        await expect(page.locator(".monaco-editor")).to_be_visible(timeout=15000)
 
         # Verify editor is functional
-        editor = app_page.locator(".monaco-editor")
-        await expect(editor).to_be_visible()
-
-        reset_button = app_page.locator("button", has_text="Reset to Example")
+        reset_button = page.locator("button", has_text="Reset to Example")
         await expect(reset_button).to_be_visible()
 
     @pytest.mark.e2e
     @pytest.mark.browser
-    async def test_page_accessibility_basics(self, app_page: Page):
+    async def test_page_accessibility_basics(self, app_page_fast: Page):
         """Test basic accessibility features."""
         # Check that the page has proper heading structure
-        h1 = app_page.locator("h1")
+        h1 = app_page_fast.locator("h1")
         await expect(h1).to_be_visible()
 
-        h2 = app_page.locator("h2")
+        h2 = app_page_fast.locator("h2")
         await expect(h2).to_be_visible()
 
         # Check that buttons have accessible text
-        reset_button = app_page.locator("button", has_text="Reset to Example")
+        reset_button = app_page_fast.locator("button", has_text="Reset to Example")
         await expect(reset_button).to_be_visible()
 
         # Verify button is keyboard accessible
         await reset_button.focus()
-        focused_element = await app_page.evaluate("document.activeElement.textContent")
+        focused_element = await app_page_fast.evaluate(
+            "document.activeElement.textContent"
+        )
         assert "Reset to Example" in focused_element
 
 
@@ -809,11 +640,10 @@ class TestYamlEditorAdvancedFeatures:
 
     @pytest.mark.e2e
     @pytest.mark.browser
-    async def test_editor_content_persistence_across_refresh(self, app_page: Page):
+    async def test_editor_content_persistence_across_refresh(
+        self, app_page: Page, monaco_ready: ElementHandle
+    ):
         """Test that editor content persists across page refreshes."""
-        # Wait for Monaco editor to load
-        await app_page.wait_for_selector(".monaco-editor", timeout=10000)
-
         # Add custom content to the editor
         custom_content = """# Custom YAML Configuration
 name: test-connector
@@ -824,24 +654,23 @@ source:
   config:
     test: true"""
 
-        # Clear editor and add custom content
-        editor_textarea = app_page.locator(".monaco-editor textarea").first()
-        await editor_textarea.click()
-        await app_page.keyboard.press("Control+a")
-        await app_page.keyboard.type(custom_content)
+        counter = app_page.locator(_COUNTER_SELECTOR).first
+        initial_text = await counter.text_content()
 
-        # Wait for content to be set
-        await app_page.wait_for_timeout(1000)
+        # Replace the editor content with the custom content
+        await _set_editor_content(app_page, custom_content)
 
-        # Refresh the page
-        await app_page.reload()
-        await app_page.wait_for_load_state("networkidle")
-        await app_page.wait_for_selector(".monaco-editor", timeout=10000)
+        # Wait for the new content to reach the state before refreshing
+        await expect(counter).not_to_have_text(initial_text)
+
+        # Refresh the page; the Reflex websocket keeps "networkidle" from settling
+        await app_page.reload(wait_until="domcontentloaded")
 
         # Check if custom content is still there (Note: This depends on implementation)
-        # For now, we'll verify the editor loads properly after refresh
-        editor = app_page.locator(".monaco-editor")
-        await expect(editor).to_be_visible()
+        # For now, we'll verify the editor accepts input again after refresh
+        await expect(app_page.locator(_EDITOR_TEXTAREA_SELECTOR).first).to_be_editable(
+            timeout=10000
+        )
 
         # Verify editor is functional after refresh
         reset_button = app_page.locator("button", has_text="Reset to Example")
@@ -849,143 +678,78 @@ source:
         await reset_button.click()
 
         # Verify reset functionality works after refresh
-        await app_page.wait_for_timeout(1000)
-        counter = app_page.locator("text=/Content length: \\d+ characters/")
         await expect(counter).to_be_visible()
 
     @pytest.mark.e2e
     @pytest.mark.browser
-    async def test_keyboard_shortcuts_select_all(self, app_page: Page):
+    async def test_keyboard_shortcuts_select_all(self, editor_page: Page):
         """Test Ctrl+A keyboard shortcut for selecting all content."""
-        # Wait for Monaco editor to load
-        await app_page.wait_for_selector(".monaco-editor", timeout=10000)
+        # The page is shared across the class, so start from the default content
+        await _reset_editor(editor_page)
 
         # Click in the editor to focus it
-        editor_textarea = app_page.locator(".monaco-editor textarea").first()
+        editor_textarea = editor_page.locator(_EDITOR_TEXTAREA_SELECTOR).first
         await editor_textarea.click()
 
         # Use Ctrl+A to select all content
-        await app_page.keyboard.press("Control+a")
+        await editor_page.keyboard.press("Control+a")
 
         # Type new content to verify selection worked
         test_content = "# Selected and replaced content"
-        await app_page.keyboard.type(test_content)
-
-        # Wait for content to update
-        await app_page.wait_for_timeout(1000)
-
-        # Verify character counter updated (indicating content changed)
-        counter = app_page.locator("text=/Content length: \\d+ characters/")
-        await expect(counter).to_be_visible()
+        await editor_page.keyboard.type(test_content)
 
         # The counter should show the length of our test content
-        counter_text = await counter.text_content()
-        assert str(len(test_content)) in counter_text
+        await _expect_counter(editor_page, len(test_content))
 
     @pytest.mark.e2e
     @pytest.mark.browser
-    async def test_keyboard_shortcuts_undo(self, app_page: Page):
+    async def test_keyboard_shortcuts_undo(self, editor_page: Page):
         """Test Ctrl+Z keyboard shortcut for undo functionality."""
-        # Wait for Monaco editor to load
-        await app_page.wait_for_selector(".monaco-editor", timeout=10000)
+        # The page is shared across the class, so start from the default content
+        await _reset_editor(editor_page)
 
         # Get initial character count
-        initial_counter = app_page.locator("text=/Content length: \\d+ characters/")
-        await expect(initial_counter).to_be_visible()
+        initial_counter = editor_page.locator(_COUNTER_SELECTOR)
         initial_text = await initial_counter.text_content()
 
         # Click in the editor and add some content
-        editor_textarea = app_page.locator(".monaco-editor textarea").first()
+        editor_textarea = editor_page.locator(_EDITOR_TEXTAREA_SELECTOR).first
         await editor_textarea.click()
-        await app_page.keyboard.press("End")  # Go to end of content
-        await app_page.keyboard.type("\n# Added content for undo test")
+        await editor_page.keyboard.press("End")  # Go to end of content
+        await editor_page.keyboard.type("\n# Added content for undo test")
 
-        # Wait for content to update
-        await app_page.wait_for_timeout(1000)
-
-        # Verify content was added (character count increased)
-        updated_counter = app_page.locator("text=/Content length: \\d+ characters/")
-        updated_text = await updated_counter.text_content()
-        assert updated_text != initial_text
+        # Verify content was added (character count changed)
+        await expect(initial_counter).not_to_have_text(initial_text)
+        updated_text = await initial_counter.text_content()
 
         # Use Ctrl+Z to undo the addition
-        await app_page.keyboard.press("Control+z")
-
-        # Wait for undo to take effect
-        await app_page.wait_for_timeout(1000)
+        await editor_page.keyboard.press("Control+z")
 
-        # Verify character count returned to initial value (or close to it)
-        final_counter = app_page.locator("text=/Content length: \\d+ characters/")
-        final_text = await final_counter.text_content()
-
-        # The count should be closer to initial than to updated
+        # The count should move away from the updated value
         # (allowing for some variation due to Monaco editor behavior)
-        assert final_text != updated_text
+        await expect(initial_counter).not_to_have_text(updated_text)
 
     @pytest.mark.e2e
     @pytest.mark.browser
-    async def test_large_yaml_file_performance(self, app_page: Page):
+    async def test_large_yaml_file_performance(
+        self, app_page: Page, monaco_ready: ElementHandle
+    ):
         """Test editor performance with large YAML content."""
-        # Wait for Monaco editor to load
-        await app_page.wait_for_selector(".monaco-editor", timeout=10000)
-
-        # Generate large YAML content (approximately 10KB)
-        large_yaml_content = """# Large YAML Configuration File
-name: large-test-connector
-version: "1.0.0"
-description: "Large connector configuration for performance testing"
-
-"""
-
-        # Add repetitive content to make it large
-        for i in range(100):
-            large_yaml_content += f"""
-source_{i:03d}:
-  type: database
-  connection:
-    host: "host-{i:03d}.example.com"
-    port: {5432 + i}
-    database: "db_{i:03d}"
-    username: "user_{i:03d}"
-    password: "password_{i:03d}"
-  tables:
-    - name: "table_{i:03d}_users"
-      columns: ["id", "name", "email", "created_at"]
-    - name: "table_{i:03d}_orders"
-      columns: ["id", "user_id", "amount", "status"]
-"""
-
-        # Record start time
-        start_time = await app_page.evaluate("Date.now()")
-
-        # Clear editor and add large content
-        editor_textarea = app_page.locator(".monaco-editor textarea").first()
-        await editor_textarea.click()
-        await app_page.keyboard.press("Control+a")
-        await app_page.keyboard.type(large_yaml_content)
+        # Large YAML content (100 database sources)
+        large_yaml_content = large_yaml()
 
-        # Wait for content to be processed
-        await app_page.wait_for_timeout(2000)
+        # Replace the editor content with the large content
+        await _set_editor_content(app_page, large_yaml_content)
 
-        # Record end time
-        end_time = await app_page.evaluate("Date.now()")
+        # Wait until the character count matches the large content; anything
+        # slower than the 10s budget below fails either way
+        content_length = len(large_yaml_content)
+        await _expect_counter(app_page, content_length, timeout=10000)
 
         # Verify editor is still responsive (performance check)
-        processing_time = end_time - start_time
+        processing_time = await app_page.evaluate(_MS_SINCE_CONTENT_SET_JS)
         assert processing_time < 10000, (
-            f"Large content processing took too long: {processing_time}ms"
-        )
-
-        # Verify editor functionality with large content
-        counter = app_page.locator("text=/Content length: \\d+ characters/")
-        await expect(counter).to_be_visible()
-
-        # Verify character count is approximately correct (within reasonable range)
-        counter_text = await counter.text_content()
-        content_length = len(large_yaml_content)
-        assert (
-            str(content_length)[:3] in counter_text
-            or str(content_length)[:4] in counter_text
+            f"Large content processing took too long: {processing_time:.0f}ms"
         )
 
         # Test that reset button still works with large content
@@ -993,13 +757,10 @@ source_{i:03d}:
         await expect(reset_button).to_be_visible()
         await reset_button.click()
 
-        # Wait for reset to complete
-        await app_page.wait_for_timeout(1000)
-
         # Verify content was reset (character count should be much smaller)
-        reset_counter = app_page.locator("text=/Content length: \\d+ characters/")
-        reset_text = await reset_counter.text_content()
-        assert reset_text != counter_text
+        await expect(app_page.locator(_COUNTER_SELECTOR).first).not_to_have_text(
+            f"Content length: {content_length} characters"
+        )
 
     @pytest.mark.e2e
     @pytest.mark.browser
@@ -1018,18 +779,19 @@ source_{i:03d}:
         await expect(editor_heading).to_be_visible()
 
         # Check that Monaco editor has proper accessibility attributes
-        await app_page.wait_for_selector(".monaco-editor", timeout=10000)
         editor = app_page.locator(".monaco-editor")
-        await expect(editor).to_be_visible()
+        await expect(editor).to_be_visible(timeout=10000)
 
         # Check for textarea within Monaco editor (should be focusable)
-        editor_textarea = app_page.locator(".monaco-editor textarea")
+        editor_textarea = app_page.locator(_EDITOR_TEXTAREA_SELECTOR)
         await expect(editor_textarea).to_be_visible()
 
-        # Test keyboard navigation to editor
-        await app_page.keyboard.press("Tab")
-        await app_page.keyboard.press("Tab")
-        await app_page.keyboard.press("Tab")  # Navigate through elements
+        # Test keyboard navigation: each Tab press should move focus onward
+        for press in range(1, 4):
+            await app_page.keyboard.press("Tab")
+            assert await app_page.evaluate(_FOCUS_MOVED_JS), (
+                f"Tab press {press} did not move focus to a new element"
+            )
 
         # Verify reset button is keyboard accessible
         reset_button = app_page.locator("button", has_text="Reset to Example")
@@ -1037,16 +799,14 @@ source_{i:03d}:
 
         # Test that Enter key activates the button
         await app_page.keyboard.press("Enter")
-        await app_page.wait_for_timeout(1000)
 
         # Verify the button action worked
-        counter = app_page.locator("text=/Content length: \\d+ characters/")
+        counter = app_page.locator(_COUNTER_SELECTOR)
         await expect(counter).to_be_visible()
 
         # Test that Space key also activates the button
         await reset_button.focus()
         await app_page.keyboard.press("Space")
-        await app_page.wait_for_timeout(1000)
 
         # Verify button is still functional
         await expect(counter).to_be_visible()
@@ -1081,19 +841,15 @@ source_{i:03d}:
         )
 
         # Verify character counter provides meaningful information
-        counter = app_page.locator("text=/Content length: \\d+ characters/")
+        counter = app_page.locator(_COUNTER_SELECTOR)
         await expect(counter).to_be_visible()
-        counter_text = await counter.text_content()
-        assert "Content length:" in counter_text, (
-            "Counter should provide clear information"
-        )
+        await expect(counter).to_contain_text("Content length:")
 
         # Test that Monaco editor is accessible to assistive technology
-        await app_page.wait_for_selector(".monaco-editor", timeout=10000)
-        editor_textarea = app_page.locator(".monaco-editor textarea")
+        editor_textarea = app_page.locator(_EDITOR_TEXTAREA_SELECTOR)
 
         # Check if textarea has proper attributes for screen readers
-        await expect(editor_textarea).to_be_visible()
+        await expect(editor_textarea).to_be_visible(timeout=10000)
 
         # Verify editor can receive focus programmatically (important for screen readers)
         await editor_textarea.focus()
@@ -1104,10 +860,10 @@ source_{i:03d}:
 
     @pytest.mark.e2e
     @pytest.mark.browser
-    async def test_editor_content_with_special_characters(self, app_page: Page):
+    async def test_editor_content_with_special_characters(self, editor_page: Page):
         """Test editor handling of special characters and Unicode content."""
-        # Wait for Monaco editor to load
-        await app_page.wait_for_selector(".monaco-editor", timeout=10000)
+        # The page is shared across the class, so start from the default content
+        await _reset_editor(editor_page)
 
         # Test content with various special characters
         special_content = """# YAML with Special Characters
@@ -1127,44 +883,21 @@ config:
   emoji_field: "🔧⚙️🛠️"
 """
 
-        # Clear editor and add special content
-        editor_textarea = app_page.locator(".monaco-editor textarea").first()
-        await editor_textarea.click()
-        await app_page.keyboard.press("Control+a")
-        await app_page.keyboard.type(special_content)
-
-        # Wait for content to be processed
-        await app_page.wait_for_timeout(1000)
-
-        # Verify character counter updates correctly with special characters
-        counter = app_page.locator("text=/Content length: \\d+ characters/")
-        await expect(counter).to_be_visible()
+        # Replace the editor content with the special content
+        await _set_editor_content(editor_page, special_content)
 
+        # Verify character counter updates correctly with special characters,
+        # allowing for some variation due to encoding differences
+        await _expect_counter(editor_page, len(special_content), tolerance=10)
+        counter = editor_page.locator(_COUNTER_SELECTOR).first
         counter_text = await counter.text_content()
-        content_length = len(special_content)
-
-        # Extract number from counter text
-        import re
-
-        counter_match = re.search(r"(\d+)", counter_text)
-        assert counter_match, "Counter should display a number"
-
-        displayed_length = int(counter_match.group(1))
-
-        # Allow for some variation due to encoding differences
-        assert abs(displayed_length - content_length) <= 10, (
-            f"Character count mismatch: expected ~{content_length}, got {displayed_length}"
-        )
 
         # Test that reset button works with special characters
-        reset_button = app_page.locator("button", has_text="Reset to Example")
+        reset_button = editor_page.locator("button", has_text="Reset to Example")
         await reset_button.click()
 
-        # Wait for reset and verify it worked
-        await app_page.wait_for_timeout(1000)
-        reset_counter = app_page.locator("text=/Content length: \\d+ characters/")
-        reset_text = await reset_counter.text_content()
-        assert reset_text != counter_text, "Reset should change the content"
+        # Verify the reset changed the content
+        await expect(counter).not_to_have_text(counter_text)
 
 
 class TestYamlEditorStateManagement:
@@ -1172,126 +905,40 @@ class TestYamlEditorStateManagement:
 
     @pytest.mark.e2e
     @pytest.mark.browser
-    async def test_extremely_long_content_state_handling(self, app_page: Page):
-        """Test YamlEditorState handling of extremely long content (>100KB)."""
-        # Wait for Monaco editor to load
-        await app_page.wait_for_selector(".monaco-editor", timeout=10000)
-
-        # Generate extremely long YAML content (approximately 100KB)
-        base_content = """# Extremely Large YAML Configuration
-name: massive-connector-config
-version: "1.0.0"
-description: "Testing state management with extremely large content"
-
-"""
-
-        # Create a very large configuration with thousands of entries
-        large_sections = []
-        for section_idx in range(50):  # 50 major sections
-            section_content = f"""
-# Section {section_idx:03d} - Database Configurations
-database_section_{section_idx:03d}:
-  type: "multi_database_section"
-  description: "Section {section_idx:03d} containing multiple database configurations"
-"""
-            # Add many database configs per section
-            for db_idx in range(100):  # 100 databases per section = 5000 total
-                db_config = f"""  database_{section_idx:03d}_{db_idx:03d}:
-    type: "postgresql"
-    connection:
-      host: "db-{section_idx:03d}-{db_idx:03d}.example.com"
-      port: {5432 + (section_idx * 100) + db_idx}
-      database: "app_db_{section_idx:03d}_{db_idx:03d}"
-      username: "user_{section_idx:03d}_{db_idx:03d}"
-      password: "secure_password_{section_idx:03d}_{db_idx:03d}"
-      ssl_mode: "require"
-      connection_timeout: 30
-      max_connections: 100
-    tables:
-      - name: "users_{section_idx:03d}_{db_idx:03d}"
-        columns: ["id", "username", "email", "created_at", "updated_at", "status"]
-        indexes: ["username", "email", "created_at"]
-      - name: "orders_{section_idx:03d}_{db_idx:03d}"
-        columns: ["id", "user_id", "product_id", "quantity", "price", "order_date"]
-        indexes: ["user_id", "product_id", "order_date"]
-      - name: "products_{section_idx:03d}_{db_idx:03d}"
-        columns: ["id", "name", "description", "price", "category", "stock"]
-        indexes: ["name", "category", "price"]
-    transformations:
-      - type: "data_validation"
-        rules:
-          - field: "email"
-            type: "email"
-            required: true
-          - field: "price"
-            type: "decimal"
-            min: 0
-      - type: "field_mapping"
-        mappings:
-          user_id: "customer_id"
-          order_date: "purchase_timestamp"
-"""
-                section_content += db_config
-            large_sections.append(section_content)
-
-        extremely_long_content = base_content + "".join(large_sections)
-
-        # Verify content is actually extremely large (should be >100KB)
+    @pytest.mark.parametrize(
+        "size_kb",
+        [
+            10,
+            pytest.param(100, marks=pytest.mark.slow),
+            pytest.param(500, marks=pytest.mark.slow),
+        ],
+    )
+    async def test_extremely_long_content_state_handling(
+        self, app_page: Page, monaco_ready: ElementHandle, size_kb: int
+    ):
+        """Test YamlEditorState handling of extremely long content.
+
+        Only the 10KB case runs by default; the larger sizes are marked slow
+        and run with ``-m slow``.
+        """
+        extremely_long_content = huge_yaml(size_kb)
+
+        # Verify content reaches the requested size
         content_size = len(extremely_long_content)
-        assert content_size > 100000, (
-            f"Content should be >100KB, got {content_size} bytes"
+        assert content_size >= size_kb * 1024, (
+            f"Content should be >={size_kb}KB, got {content_size} bytes"
         )
 
-        # Record start time for performance measurement
-        start_time = await app_page.evaluate("Date.now()")
-
-        # Attempt to set extremely long content in editor
-        editor_textarea = app_page.locator(".monaco-editor textarea").first()
-        await editor_textarea.click()
-        await app_page.keyboard.press("Control+a")
-
-        # Set content in chunks to avoid browser limitations
-        chunk_size = 10000
-        for i in range(0, len(extremely_long_content), chunk_size):
-            chunk = extremely_long_content[i : i + chunk_size]
-            if i == 0:
-                await app_page.keyboard.type(chunk)
-            else:
-                await app_page.keyboard.type(chunk)
-
-            # Small pause between chunks to allow processing
-            await app_page.wait_for_timeout(100)
+        # Set the extremely long content in the editor in one call
+        await _set_editor_content(app_page, extremely_long_content)
 
         # Wait for content processing to complete
-        await app_page.wait_for_timeout(3000)
-
-        # Record end time
-        end_time = await app_page.evaluate("Date.now()")
-        processing_time = end_time - start_time
+        await _expect_counter(app_page, content_size, timeout=30000)
+        processing_time = await app_page.evaluate(_MS_SINCE_CONTENT_SET_JS)
 
         # Verify state management performance (should handle large content within reasonable time)
         assert processing_time < 30000, (
-            f"Extremely large content processing took too long: {processing_time}ms"
-        )
-
-        # Verify character counter updates correctly with extremely long content
-        counter = app_page.locator("text=/Content length: \\d+ characters/")
-        await expect(counter).to_be_visible()
-
-        counter_text = await counter.text_content()
-        import re
-
-        counter_match = re.search(r"(\d+)", counter_text)
-        assert counter_match, (
-            "Counter should display character count for extremely long content"
-        )
-
-        displayed_length = int(counter_match.group(1))
-
-        # Allow for reasonable variation due to processing differences
-        length_difference = abs(displayed_length - content_size)
-        assert length_difference < 1000, (
-            f"Character count significantly off for large content: expected ~{content_size}, got {displayed_length}"
+            f"Extremely large content processing took too long: {processing_time:.0f}ms"
         )
 
         # Test that state can still be reset even with extremely long content
@@ -1299,27 +946,18 @@ database_section_{section_idx:03d}:
         await expect(reset_button).to_be_visible()
         await reset_button.click()
 
-        # Wait for reset to complete
-        await app_page.wait_for_timeout(2000)
-
-        # Verify reset worked (character count should be much smaller)
-        reset_counter = app_page.locator("text=/Content length: \\d+ characters/")
-        reset_text = await reset_counter.text_content()
-        reset_match = re.search(r"(\d+)", reset_text)
-        assert reset_match, "Counter should show reset content length"
-
-        reset_length = int(reset_match.group(1))
+        # Wait for the reset to land (character count should be much smaller)
+        reset_length = await _wait_for_counter_between(app_page, 0, 999)
         assert reset_length < 1000, (
             f"Reset should result in much smaller content, got {reset_length} characters"
         )
 
     @pytest.mark.e2e
     @pytest.mark.browser
-    async def test_special_characters_state_persistence(self, app_page: Page):
+    async def test_special_characters_state_persistence(
+        self, app_page: Page, monaco_ready: ElementHandle
+    ):
         """Test YamlEditorState handling of complex special characters and encoding."""
-        # Wait for Monaco editor to load
-        await app_page.wait_for_selector(".monaco-editor", timeout=10000)
-
         # Create content with extensive special characters that could break state management
         special_chars_content = """# Complex Special Characters State Test
 name: "special-chars-connector-测试"
@@ -1385,33 +1023,15 @@ transformations:
     fallback_encoding: "ISO-8859-1"
 """
 
-        # Clear editor and set special characters content
-        editor_textarea = app_page.locator(".monaco-editor textarea").first()
-        await editor_textarea.click()
-        await app_page.keyboard.press("Control+a")
-        await app_page.keyboard.type(special_chars_content)
-
-        # Wait for content to be processed
-        await app_page.wait_for_timeout(2000)
+        # Replace the editor content with the special characters content
+        await _set_editor_content(app_page, special_chars_content)
 
         # Verify character counter handles special characters correctly
-        counter = app_page.locator("text=/Content length: \\d+ characters/")
+        counter = app_page.locator(_COUNTER_SELECTOR)
         await expect(counter).to_be_visible()
 
-        counter_text = await counter.text_content()
-        import re
-
-        counter_match = re.search(r"(\d+)", counter_text)
-        assert counter_match, "Counter should handle special characters"
-
-        displayed_length = int(counter_match.group(1))
-        actual_length = len(special_chars_content)
-
-        # Allow for encoding differences but should be reasonably close
-        length_difference = abs(displayed_length - actual_length)
-        assert length_difference < 100, (
-            f"Special character counting error: expected ~{actual_length}, got {displayed_length}"
-        )
+        displayed_length = len(special_chars_content)
+        await _expect_counter(app_page, displayed_length)
 
         # Test state persistence by performing multiple operations
         operations = [
@@ -1424,70 +1044,65 @@ transformations:
             # Add content
             await app_page.keyboard.press("End")
             await app_page.keyboard.type(additional_content)
-            await app_page.wait_for_timeout(500)
-
-            # Verify counter updates
-            updated_counter = app_page.locator("text=/Content length: \\d+ characters/")
-            updated_text = await updated_counter.text_content()
-            updated_match = re.search(r"(\d+)", updated_text)
-            assert updated_match, f"Counter should update after {operation_name}"
 
-            updated_length = int(updated_match.group(1))
-            assert updated_length > displayed_length, (
-                f"Length should increase after {operation_name}"
-            )
-            displayed_length = updated_length
+            # Verify counter updates (auto-closed quotes and indentation may add
+            # a few characters beyond the typed text)
+            try:
+                displayed_length = await _wait_for_counter_between(
+                    app_page,
+                    displayed_length + 1,
+                    displayed_length + 4 * len(additional_content),
+                )
+            except PlaywrightTimeoutError as e:
+                raise AssertionError(
+                    f"Length should increase after {operation_name}"
+                ) from e
 
         # Test reset functionality with special characters
         reset_button = app_page.locator("button", has_text="Reset to Example")
         await reset_button.click()
-        await app_page.wait_for_timeout(1000)
 
         # Verify reset worked
-        reset_counter = app_page.locator("text=/Content length: \\d+ characters/")
-        reset_text = await reset_counter.text_content()
-        reset_match = re.search(r"(\d+)", reset_text)
-        assert reset_match, "Counter should show reset length"
-
-        reset_length = int(reset_match.group(1))
+        reset_length = await _wait_for_counter_between(
+            app_page, 0, displayed_length - 1
+        )
         assert reset_length < displayed_length, (
             "Reset should reduce content length significantly"
         )
 
     @pytest.mark.e2e
     @pytest.mark.browser
-    async def test_concurrent_state_updates_simulation(self, app_page: Page):
+    async def test_concurrent_state_updates_simulation(
+        self, app_page: Page, monaco_ready: ElementHandle
+    ):
         """Test YamlEditorState handling of rapid concurrent-like state updates."""
-        # Wait for Monaco editor to load
-        await app_page.wait_for_selector(".monaco-editor", timeout=10000)
-
         # Simulate rapid state changes that could cause race conditions
-        editor_textarea = app_page.locator(".monaco-editor textarea").first()
+        editor_textarea = app_page.locator(_EDITOR_TEXTAREA_SELECTOR).first
         await editor_textarea.click()
 
         # Clear initial content
         await app_page.keyboard.press("Control+a")
 
-        # Perform rapid sequential operations to test state consistency
+        # Perform rapid sequential operations to test state consistency. Each
+        # operation carries the character count expected once it has applied
+        # (select-all leaves the count unchanged, typing replaces the selection).
+        content_1 = "# First content block\nname: connector-1"
+        content_2 = "# Second content block\nname: connector-2\nversion: 1.0"
+        addition = "\ndescription: rapid update test"
+        content_3 = (
+            "# Third content block\nname: connector-3\nversion: 2.0\n"
+            "description: final test"
+        )
         rapid_operations = [
-            ("Type content 1", "# First content block\nname: connector-1"),
-            ("Select all", "Control+a"),
-            (
-                "Type content 2",
-                "# Second content block\nname: connector-2\nversion: 1.0",
-            ),
-            ("Add more", "\ndescription: rapid update test"),
-            ("Select all again", "Control+a"),
-            (
-                "Type content 3",
-                "# Third content block\nname: connector-3\nversion: 2.0\ndescription: final test",
-            ),
+            ("Type content 1", content_1, len(content_1)),
+            ("Select all", "Control+a", len(content_1)),
+            ("Type content 2", content_2, len(content_2)),
+            ("Add more", addition, len(content_2) + len(addition)),
+            ("Select all again", "Control+a", len(content_2) + len(addition)),
+            ("Type content 3", content_3, len(content_3)),
         ]
 
-        # Track character counts to verify state consistency
-        character_counts = []
-
-        for operation_name, operation in rapid_operations:
+        for operation_name, operation, expected_count in rapid_operations:
             if operation.startswith("Control+"):
                 # Keyboard shortcut
                 await app_page.keyboard.press(operation)
@@ -1495,333 +1110,124 @@ transformations:
                 # Text input
                 await app_page.keyboard.type(operation)
 
-            # Minimal wait to simulate rapid operations
-            await app_page.wait_for_timeout(100)
-
-            # Check character counter after each operation
-            counter = app_page.locator("text=/Content length: \\d+ characters/")
-            await expect(counter).to_be_visible()
-
-            counter_text = await counter.text_content()
-            import re
-
-            counter_match = re.search(r"(\d+)", counter_text)
-            assert counter_match, f"Counter should be visible after {operation_name}"
-
-            char_count = int(counter_match.group(1))
-            character_counts.append((operation_name, char_count))
-
-        # Verify that character counts follow logical progression
-        # (some operations should increase count, select-all shouldn't change it)
-
-        # Verify final state is consistent
-        final_count = character_counts[-1][1]
-        assert final_count > 0, "Final character count should be positive"
+            # Move on as soon as the counter reflects the operation
+            try:
+                await _expect_counter(app_page, expected_count, timeout=2000)
+            except AssertionError as e:
+                raise AssertionError(
+                    f"Counter did not show {expected_count} after {operation_name}"
+                ) from e
 
         # Test rapid reset operations
         reset_button = app_page.locator("button", has_text="Reset to Example")
 
-        # Perform multiple rapid resets to test state stability
-        for _i in range(5):
-            await reset_button.click()
-            await app_page.wait_for_timeout(
-                50
-            )  # Very short wait to simulate rapid clicks
+        # Perform multiple rapid resets to test state stability, dispatched
+        # back to back in the browser
+        await app_page.evaluate(_RESET_CLICK_BURST_JS, 5)
 
-        # Wait for final reset to complete
-        await app_page.wait_for_timeout(1000)
-
-        # Verify state is consistent after rapid resets
-        final_counter = app_page.locator("text=/Content length: \\d+ characters/")
-        final_text = await final_counter.text_content()
-        final_match = re.search(r"(\d+)", final_text)
-        assert final_match, "Counter should be stable after rapid resets"
-
-        final_reset_count = int(final_match.group(1))
-
-        # The count should be the default example length (should be consistent)
-        assert 200 < final_reset_count < 800, (
-            f"Reset count should be in expected range for default content, got {final_reset_count}"
-        )
+        # The count should settle on the default example length
+        final_reset_count = await _wait_for_counter_between(app_page, 201, 799)
 
         # Test rapid content changes followed by reset
         await editor_textarea.click()
 
-        # Rapid content modifications
+        # Rapid content modifications, applied as one Monaco edit
         modifications = [
             "# Rapid test 1",
             "\nname: test-1",
             "\nversion: 1.0",
             "\ndescription: testing rapid changes",
         ]
+        appended = "".join(modifications)
+        await app_page.evaluate(_APPEND_EDITOR_TEXT_JS, appended)
 
-        for mod in modifications:
-            await app_page.keyboard.press("End")
-            await app_page.keyboard.type(mod)
-            await app_page.wait_for_timeout(50)  # Minimal wait
+        # The edit must reach the state first, otherwise the reset is a no-op
+        # and the check below passes without exercising anything
+        await _expect_counter(app_page, final_reset_count + len(appended), tolerance=5)
 
         # Immediate reset after rapid changes
         await reset_button.click()
-        await app_page.wait_for_timeout(1000)
-
-        # Verify state is back to default
-        post_rapid_counter = app_page.locator("text=/Content length: \\d+ characters/")
-        post_rapid_text = await post_rapid_counter.text_content()
-        post_rapid_match = re.search(r"(\d+)", post_rapid_text)
-        assert post_rapid_match, (
-            "Counter should show default after rapid changes + reset"
-        )
-
-        post_rapid_count = int(post_rapid_match.group(1))
 
-        # Should be same as previous reset count (state consistency)
-        count_difference = abs(post_rapid_count - final_reset_count)
-        assert count_difference <= 5, (
-            f"State should be consistent after rapid operations: {post_rapid_count} vs {final_reset_count}"
-        )
+        # Should be back to the previous reset count (state consistency)
+        await _expect_counter(app_page, final_reset_count, tolerance=5)
 
     @pytest.mark.e2e
     @pytest.mark.browser
-    async def test_state_boundary_conditions(self, app_page: Page):
-        """Test YamlEditorState with boundary conditions and edge cases."""
-        # Wait for Monaco editor to load
-        await app_page.wait_for_selector(".monaco-editor", timeout=10000)
-
-        editor_textarea = app_page.locator(".monaco-editor textarea").first()
+    @pytest.mark.parametrize(
+        "content",
+        [
+            pytest.param("", id="empty"),
+            pytest.param("x", id="single-char"),
+            pytest.param("   \n\n\t\t\t   \n   ", id="whitespace"),
+            pytest.param("!@#$%^&*()_+-={}[]|\\:;\"'<>?,./", id="special-chars"),
+        ],
+    )
+    async def test_state_boundary_conditions(
+        self, app_page: Page, monaco_ready: ElementHandle, content: str
+    ):
+        """Test YamlEditorState with boundary-condition content and a reset from it."""
+        editor_textarea = app_page.locator(_EDITOR_TEXTAREA_SELECTOR).first
         await editor_textarea.click()
 
-        # Test 1: Empty content state
+        # Replace the content with the boundary condition in a single input
+        # event, so Monaco's auto-closing and auto-indent do not alter it
         await app_page.keyboard.press("Control+a")
-        await app_page.keyboard.press("Delete")
-        await app_page.wait_for_timeout(500)
-
-        # Verify empty state handling
-        counter = app_page.locator("text=/Content length: \\d+ characters/")
-        await expect(counter).to_be_visible()
-
-        empty_text = await counter.text_content()
-        import re
-
-        empty_match = re.search(r"(\d+)", empty_text)
-        assert empty_match, "Counter should handle empty content"
-
-        empty_count = int(empty_match.group(1))
-        assert empty_count == 0, (
-            f"Empty content should show 0 characters, got {empty_count}"
-        )
-
-        # Test 2: Single character state
-        await app_page.keyboard.type("a")
-        await app_page.wait_for_timeout(300)
-
-        single_counter = app_page.locator("text=/Content length: \\d+ characters/")
-        single_text = await single_counter.text_content()
-        single_match = re.search(r"(\d+)", single_text)
-        assert single_match, "Counter should handle single character"
-
-        single_count = int(single_match.group(1))
-        assert single_count == 1, f"Single character should show 1, got {single_count}"
-
-        # Test 3: Whitespace-only content
-        await app_page.keyboard.press("Control+a")
-        whitespace_content = "   \n\n\t\t\t   \n   "
-        await app_page.keyboard.type(whitespace_content)
-        await app_page.wait_for_timeout(500)
-
-        whitespace_counter = app_page.locator("text=/Content length: \\d+ characters/")
-        whitespace_text = await whitespace_counter.text_content()
-        whitespace_match = re.search(r"(\d+)", whitespace_text)
-        assert whitespace_match, "Counter should handle whitespace-only content"
-
-        whitespace_count = int(whitespace_match.group(1))
-        expected_whitespace_count = len(whitespace_content)
-        assert whitespace_count == expected_whitespace_count, (
-            f"Whitespace count should be {expected_whitespace_count}, got {whitespace_count}"
-        )
-
-        # Test 4: Content with only special characters
-        await app_page.keyboard.press("Control+a")
-        special_only = "!@#$%^&*()_+-={}[]|\\:;\"'<>?,./"
-        await app_page.keyboard.type(special_only)
-        await app_page.wait_for_timeout(500)
-
-        special_counter = app_page.locator("text=/Content length: \\d+ characters/")
-        special_text = await special_counter.text_content()
-        special_match = re.search(r"(\d+)", special_text)
-        assert special_match, "Counter should handle special characters only"
-
-        special_count = int(special_match.group(1))
-        expected_special_count = len(special_only)
-        assert special_count == expected_special_count, (
-            f"Special chars count should be {expected_special_count}, got {special_count}"
-        )
-
-        # Test 5: Reset from each boundary condition
-        boundary_conditions = [
-            ("empty", 0),
-            ("single char", 1),
-            ("whitespace", len(whitespace_content)),
-            ("special chars", len(special_only)),
-        ]
-
-        reset_button = app_page.locator("button", has_text="Reset to Example")
+        if content:
+            await app_page.keyboard.insert_text(content)
+        else:
+            await app_page.keyboard.press("Delete")
 
-        for condition_name, expected_count in boundary_conditions:
-            # Set the boundary condition content
-            await app_page.keyboard.press("Control+a")
+        # Verify the boundary condition is reflected in the counter
+        await _expect_counter(app_page, len(content))
 
-            if condition_name == "empty":
-                await app_page.keyboard.press("Delete")
-            elif condition_name == "single char":
-                await app_page.keyboard.type("x")
-            elif condition_name == "whitespace":
-                await app_page.keyboard.type(whitespace_content)
-            elif condition_name == "special chars":
-                await app_page.keyboard.type(special_only)
-
-            await app_page.wait_for_timeout(300)
-
-            # Verify the boundary condition is set
-            pre_reset_counter = app_page.locator(
-                "text=/Content length: \\d+ characters/"
-            )
-            pre_reset_text = await pre_reset_counter.text_content()
-            pre_reset_match = re.search(r"(\d+)", pre_reset_text)
-            assert pre_reset_match, f"Should show count for {condition_name}"
-
-            pre_reset_count = int(pre_reset_match.group(1))
-            assert pre_reset_count == expected_count, (
-                f"Pre-reset count for {condition_name} should be {expected_count}, got {pre_reset_count}"
-            )
-
-            # Reset and verify
-            await reset_button.click()
-            await app_page.wait_for_timeout(1000)
-
-            post_reset_counter = app_page.locator(
-                "text=/Content length: \\d+ characters/"
-            )
-            post_reset_text = await post_reset_counter.text_content()
-            post_reset_match = re.search(r"(\d+)", post_reset_text)
-            assert post_reset_match, f"Should show reset count after {condition_name}"
-
-            post_reset_count = int(post_reset_match.group(1))
-            assert post_reset_count > 200, (
-                f"Reset from {condition_name} should restore default content, got {post_reset_count}"
-            )
+        # Reset and verify the default content is restored
+        await app_page.locator("button", has_text="Reset to Example").click()
+        await _wait_for_counter_between(app_page, 201, 10000)
 
     @pytest.mark.e2e
     @pytest.mark.browser
-    async def test_state_memory_efficiency(self, app_page: Page):
+    async def test_state_memory_efficiency(
+        self, app_page: Page, monaco_ready: ElementHandle
+    ):
         """Test YamlEditorState memory efficiency with repeated large operations."""
-        # Wait for Monaco editor to load
-        await app_page.wait_for_selector(".monaco-editor", timeout=10000)
-
-        editor_textarea = app_page.locator(".monaco-editor textarea").first()
+        editor_textarea = app_page.locator(_EDITOR_TEXTAREA_SELECTOR).first
+        reset_button = app_page.locator("button", has_text="Reset to Example")
         await editor_textarea.click()
 
         # Test repeated large content operations to check for memory leaks
-        large_content_template = """# Memory Efficiency Test - Iteration {iteration}
-name: memory-test-connector-{iteration}
-version: "1.{iteration}.0"
-description: "Testing memory efficiency with repeated large operations"
-
-# Large configuration section for iteration {iteration}
-"""
-
-        # Add substantial content for each iteration
-        for section in range(20):  # 20 sections per iteration
-            large_content_template += f"""
-section_{section:02d}:
-  type: "database_cluster"
-  iteration: {section}
-  section_id: {section}
-  databases:
-"""
-            for db in range(10):  # 10 databases per section
-                large_content_template += f"""    - name: "db_{section:02d}_{db:02d}"
-      host: "host-{section}-{db}.example.com"
-      port: {5432 + section * 10 + db}
-      config:
-        max_connections: 100
-        timeout: 30
-        ssl: true
-"""
+        large_content_template = memory_yaml_template()
 
         # Perform multiple iterations of large content operations
         iterations = 5
-        reset_button = app_page.locator("button", has_text="Reset to Example")
 
         for iteration in range(iterations):
             # Generate large content for this iteration
             large_content = large_content_template.format(iteration=iteration)
 
-            # Clear and set large content
-            await app_page.keyboard.press("Control+a")
-
-            # Set content in manageable chunks to avoid browser timeouts
-            chunk_size = 5000
-            for i in range(0, len(large_content), chunk_size):
-                chunk = large_content[i : i + chunk_size]
-                if i == 0:
-                    await app_page.keyboard.type(chunk)
-                else:
-                    await app_page.keyboard.type(chunk)
-                await app_page.wait_for_timeout(50)
-
-            # Wait for processing
-            await app_page.wait_for_timeout(1000)
+            # Replace the content in one call rather than typing it
+            await _set_editor_content(app_page, large_content)
 
             # Verify state is consistent
-            counter = app_page.locator("text=/Content length: \\d+ characters/")
-            await expect(counter).to_be_visible()
-
-            counter_text = await counter.text_content()
-            import re
-
-            counter_match = re.search(r"(\d+)", counter_text)
-            assert counter_match, f"Counter should work in iteration {iteration}"
-
-            char_count = int(counter_match.group(1))
-            expected_count = len(large_content)
-
-            # Allow for reasonable variation
-            count_difference = abs(char_count - expected_count)
-            assert count_difference < 100, (
-                f"Iteration {iteration}: count difference too large: {count_difference}"
-            )
+            try:
+                await _expect_counter(app_page, len(large_content))
+            except AssertionError as e:
+                raise AssertionError(
+                    f"Iteration {iteration}: count should be {len(large_content)}"
+                ) from e
 
             # Reset to clear memory
             await reset_button.click()
-            await app_page.wait_for_timeout(1000)
 
             # Verify reset worked
-            reset_counter = app_page.locator("text=/Content length: \\d+ characters/")
-            reset_text = await reset_counter.text_content()
-            reset_match = re.search(r"(\d+)", reset_text)
-            assert reset_match, f"Reset should work in iteration {iteration}"
-
-            reset_count = int(reset_match.group(1))
-            assert reset_count < 1000, (
-                f"Reset should clear large content in iteration {iteration}, got {reset_count}"
-            )
+            reset_count = await _wait_for_counter_between(app_page, 0, 999)
 
         # Final verification that state is still responsive after all iterations
+        final_text = "# Final test after memory efficiency test"
         await editor_textarea.click()
-        await app_page.keyboard.type("# Final test after memory efficiency test")
-        await app_page.wait_for_timeout(500)
-
-        final_counter = app_page.locator("text=/Content length: \\d+ characters/")
-        final_text = await final_counter.text_content()
-        final_match = re.search(r"(\d+)", final_text)
-        assert final_match, (
-            "State should still be responsive after memory efficiency test"
-        )
+        await app_page.keyboard.type(final_text)
 
-        final_count = int(final_match.group(1))
-        assert final_count > 200, (
-            "Final state should include both default and added content"
-        )
+        # Final state should include both default and added content
+        await _expect_counter(app_page, reset_count + len(final_text))
 
 
 class TestConnectorBuilderTabs:
@@ -1945,28 +1351,15 @@ class TestConnectorBuilderTabs:
         code_tab = app_page.locator("button[role='tab']:has-text('Code')")
         await code_tab.click()
 
-        # Wait for Monaco editor to be ready (reuse existing helper)
-        await self._wait_for_monaco_editor_ready(app_page)
+        # The editor mounts with the Code tab, so wait for it after switching
+        await expect(app_page.locator(_EDITOR_TEXTAREA_SELECTOR)).to_be_attached(
+            timeout=15000
+        )
 
         # Test that reset button still works
         reset_button = app_page.locator("button:has-text('Reset to Example')")
         await expect(reset_button).to_be_visible()
         await expect(reset_button).to_be_enabled()
 
-        editor_element = app_page.locator(".monaco-editor").first()
+        editor_element = app_page.locator(".monaco-editor").first
         await expect(editor_element).to_contain_text("example-connector")
-
-    async def _wait_for_monaco_editor_ready(
-        self, page: Page, timeout: int = 15000
-    ) -> None:
-        """Wait for Monaco editor to be fully loaded and ready."""
-        try:
-            await page.wait_for_selector(".monaco-editor", timeout=timeout)
-            await page.wait_for_selector(
-                ".monaco-editor .monaco-editor-background", timeout=5000
-            )
-            await page.wait_for_selector(".monaco-editor textarea", timeout=5000)
-        except PlaywrightTimeoutError as e:
-            raise AssertionError(
-                f"Monaco editor failed to load within {timeout}ms. Error: {str(e)}"
-            ) from e
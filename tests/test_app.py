@@ -2,28 +2,24 @@
 
 import pytest
 
-from app.agentic_connector_builder_webapp import (
-    ConnectorBuilderState,
-    index,
-)
-from agentic_connector_builder_webapp.components.yaml_editor import (
-    yaml_editor_component,
-)
-from agentic_connector_builder_webapp.tabs.requirements_tab import (
-    requirements_tab_content,
-)
+from app.app import CHAT_HISTORY_PAGE_SIZE, ConnectorBuilderState, index
+from app.components.yaml_editor import yaml_editor_component
+from app.tabs.requirements_tab import requirements_tab_content
+
+# Built once at import rather than in each test run.
+LARGE_YAML_CONTENT = "\n".join(f"item_{i}: value_{i}" for i in range(1000))
 
 
 class TestConnectorBuilderState:
     """Test cases for ConnectorBuilderState class."""
 
     @pytest.mark.unit
-    def test_initial_yaml_content(self, yaml_editor_state):
+    def test_initial_yaml_content(self, yaml_editor_state_readonly):
         """Test that ConnectorBuilderState has initial YAML content."""
-        assert yaml_editor_state.yaml_content is not None
-        assert len(yaml_editor_state.yaml_content) > 0
-        assert "name: example-connector" in yaml_editor_state.yaml_content
-        assert 'version: "1.0.0"' in yaml_editor_state.yaml_content
+        assert yaml_editor_state_readonly.yaml_content is not None
+        assert len(yaml_editor_state_readonly.yaml_content) > 0
+        assert "name: example-connector" in yaml_editor_state_readonly.yaml_content
+        assert 'version: "1.0.0"' in yaml_editor_state_readonly.yaml_content
 
     @pytest.mark.unit
     def test_update_yaml_content(self, yaml_editor_state, sample_yaml_content):
@@ -66,6 +62,46 @@ class TestConnectorBuilderState:
         # Content should persist
         assert yaml_editor_state.yaml_content == test_content
 
+    @pytest.mark.unit
+    def test_yaml_content_length(self, yaml_editor_state, sample_yaml_content):
+        """Test that the content length tracks the YAML content."""
+        assert yaml_editor_state.yaml_content_length == len(
+            yaml_editor_state.yaml_content
+        )
+
+        yaml_editor_state.update_yaml_content(sample_yaml_content)
+        assert yaml_editor_state.yaml_content_length == len(sample_yaml_content)
+
+    @pytest.mark.unit
+    def test_extremely_long_yaml_content(self, yaml_editor_state):
+        """Test updating and resetting YAML content larger than 100KB."""
+        entry = 'database_{i:05d}:\n  host: "db-{i:05d}.example.com"\n'
+        long_content = "".join(entry.format(i=i) for i in range(5000))
+        assert len(long_content) > 100000
+
+        yaml_editor_state.update_yaml_content(long_content)
+        assert yaml_editor_state.yaml_content == long_content
+        assert yaml_editor_state.yaml_content_length == len(long_content)
+
+        yaml_editor_state.reset_yaml_content()
+        assert yaml_editor_state.yaml_content_length < 1000
+
+    @pytest.mark.unit
+    def test_special_characters_yaml_content(self, yaml_editor_state):
+        """Test that Unicode and escape characters are stored and counted exactly."""
+        special_content = (
+            'name: "special-chars-connector-测试"\n'
+            'emoji_status: "✅ Active 🚀 Running"\n'
+            'mixed_script: "English中文العربيةрусский日本語한국어ไทย"\n'
+            'combining_chars: "e̊x̊ȧm̊p̊l̊e̊"\n'
+            'surrogate_pairs: "𝕳𝖊𝖑𝖑𝖔"\n'
+            'escapes: "\\n \\t \\\\"\n'
+        )
+
+        yaml_editor_state.update_yaml_content(special_content)
+        assert yaml_editor_state.yaml_content == special_content
+        assert yaml_editor_state.yaml_content_length == len(special_content)
+
     @pytest.mark.unit
     def test_yaml_content_type(self, yaml_editor_state):
         """Test that YAML content is always a string."""
@@ -110,6 +146,7 @@ class TestYamlEditorComponent:
             documentation_urls="https://example.com",
             functional_requirements="Test requirements",
             test_list="assert True",
+            fields_disabled=False,
             on_source_api_name_change=ConnectorBuilderState.set_source_api_name,
             on_connector_name_change=ConnectorBuilderState.set_connector_name,
             on_documentation_urls_change=ConnectorBuilderState.set_documentation_urls,
@@ -145,18 +182,14 @@ class TestAppConfiguration:
     @pytest.mark.unit
     def test_app_import(self):
         """Test that the app can be imported successfully."""
-        from agentic_connector_builder_webapp.agentic_connector_builder_webapp import (
-            app,
-        )
+        from app.app import app
 
         assert app is not None
 
     @pytest.mark.unit
     def test_app_has_pages(self):
         """Test that the app has pages configured."""
-        from agentic_connector_builder_webapp.agentic_connector_builder_webapp import (
-            app,
-        )
+        from app.app import app
 
         # App should have pages configured
         assert hasattr(app, "pages") or hasattr(app, "_pages")
@@ -191,9 +224,8 @@ config:
     @pytest.mark.unit
     def test_large_yaml_content(self, yaml_editor_state):
         """Test handling of large YAML content."""
-        large_content = "\n".join([f"item_{i}: value_{i}" for i in range(1000)])
-        yaml_editor_state.update_yaml_content(large_content)
-        assert yaml_editor_state.yaml_content == large_content
+        yaml_editor_state.update_yaml_content(LARGE_YAML_CONTENT)
+        assert yaml_editor_state.yaml_content == LARGE_YAML_CONTENT
         assert len(yaml_editor_state.yaml_content.split("\n")) == 1000
 
 
@@ -229,3 +261,90 @@ class TestStateManagement:
 
         yaml_editor_state.update_yaml_content("")
         assert yaml_editor_state.yaml_content == ""
+
+
+class TestRequirementsState:
+    """Test cases for the requirements field handlers."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("handler", "field"),
+        [
+            ("commit_source_api_name", "source_api_name"),
+            ("commit_connector_name", "connector_name"),
+            ("commit_documentation_urls", "documentation_urls"),
+            ("commit_functional_requirements", "functional_requirements"),
+            ("commit_test_list", "test_list"),
+        ],
+    )
+    def test_commit_skips_unchanged_value(self, yaml_editor_state, handler, field):
+        """Test that committing the current value does not mark the field dirty."""
+        getattr(yaml_editor_state, handler)("value")
+        assert getattr(yaml_editor_state, field) == "value"
+
+        yaml_editor_state.dirty_vars.clear()
+        getattr(yaml_editor_state, handler)("value")
+        assert field not in yaml_editor_state.dirty_vars
+
+        getattr(yaml_editor_state, handler)("other value")
+        assert getattr(yaml_editor_state, field) == "other value"
+        assert field in yaml_editor_state.dirty_vars
+
+
+class TestChatHistoryWindow:
+    """Test cases for the windowed chat history."""
+
+    @staticmethod
+    def _add_messages(state, count: int) -> None:
+        """Append ``count`` alternating user and assistant messages."""
+        for i in range(count):
+            state._append_chat_message(
+                "user" if i % 2 == 0 else "assistant", f"message {i}"
+            )
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "count",
+        [
+            pytest.param(CHAT_HISTORY_PAGE_SIZE - 1, id="fewer"),
+            pytest.param(CHAT_HISTORY_PAGE_SIZE, id="exact"),
+        ],
+    )
+    def test_window_shows_all_messages_up_to_page_size(self, yaml_editor_state, count):
+        """Test that no messages are hidden while the history fits in one page."""
+        self._add_messages(yaml_editor_state, count)
+
+        assert yaml_editor_state.visible_chat_contents == [
+            f"message {i}" for i in range(count)
+        ]
+        assert len(yaml_editor_state.visible_chat_roles) == count
+        assert yaml_editor_state.hidden_chat_message_count == 0
+
+    @pytest.mark.unit
+    def test_window_shows_most_recent_page(self, yaml_editor_state):
+        """Test that only the latest page is visible once the history overflows."""
+        count = CHAT_HISTORY_PAGE_SIZE + 5
+        self._add_messages(yaml_editor_state, count)
+
+        assert yaml_editor_state.visible_chat_contents == [
+            f"message {i}" for i in range(5, count)
+        ]
+        assert yaml_editor_state.visible_chat_roles == yaml_editor_state.chat_roles[5:]
+        assert yaml_editor_state.hidden_chat_message_count == 5
+
+    @pytest.mark.unit
+    def test_show_earlier_messages_grows_window(self, yaml_editor_state):
+        """Test that show_earlier_messages reveals one more page of history."""
+        count = 2 * CHAT_HISTORY_PAGE_SIZE + 5
+        self._add_messages(yaml_editor_state, count)
+        assert yaml_editor_state.hidden_chat_message_count == CHAT_HISTORY_PAGE_SIZE + 5
+
+        yaml_editor_state.show_earlier_messages()
+        assert len(yaml_editor_state.visible_chat_contents) == (
+            2 * CHAT_HISTORY_PAGE_SIZE
+        )
+        assert yaml_editor_state.hidden_chat_message_count == 5
+
+        yaml_editor_state.show_earlier_messages()
+        assert len(yaml_editor_state.visible_chat_contents) == count
+        assert yaml_editor_state.hidden_chat_message_count == 0
@@ -1,6 +1,7 @@
 """Tests for manifest editing tools in chat_agent."""
 
-from unittest.mock import Mock
+import dataclasses
+from types import SimpleNamespace
 
 import pytest
 
@@ -24,19 +25,57 @@ destination:
 
 MULTILINE_YAML = "\n".join([f"line {i}" for i in range(1, 21)])
 
+LARGE_MULTILINE_YAML = "\n".join([f"line {i}" for i in range(1, 100_001)])
 
-def create_mock_ctx(yaml_content=""):
-    """Create a mock RunContext with specified YAML content."""
-    ctx = Mock()
-    ctx.deps = SessionDeps(
-        yaml_content=yaml_content,
+# Expected substrings shared by several parametrized cases.
+NO_CONTENT_ERROR = ("Error: No YAML content available",)
+START_LINE_RANGE_ERROR = ("Error: start_line", "out of range")
+
+
+@pytest.fixture(scope="module")
+def deps_template():
+    """SessionDeps with the metadata shared by every test context."""
+    return SessionDeps(
+        yaml_content="",
         connector_name="test-connector",
         source_api_name="TestAPI",
         documentation_urls="",
         functional_requirements="",
         test_list="",
     )
-    return ctx
+
+
+@pytest.fixture
+def make_ctx(deps_template):
+    """Factory for stand-in RunContexts holding the given YAML content.
+
+    The tools only read `ctx.deps`, so a plain namespace is enough; each
+    context gets its own copy of the template deps.
+    """
+
+    def _make_ctx(yaml_content=""):
+        return SimpleNamespace(
+            deps=dataclasses.replace(deps_template, yaml_content=yaml_content)
+        )
+
+    return _make_ctx
+
+
+def _assert_edit_outcome(
+    ctx, original_content, result, expected_in_result, expected_at_line, should_modify
+):
+    """Check an edit tool's message and whether it changed the manifest as expected."""
+    missing = [s for s in expected_in_result if s not in result]
+    assert not missing, f"missing {missing} in {result!r}"
+
+    if should_modify:
+        assert ctx.deps.yaml_content != original_content
+        assert ctx.deps.yaml_content_modified
+        lines = ctx.deps.manifest_lines()
+        assert {i: lines[i] for i in expected_at_line} == expected_at_line
+    else:
+        assert ctx.deps.yaml_content == original_content
+        assert not ctx.deps.yaml_content_modified
 
 
 @pytest.mark.parametrize(
@@ -47,8 +86,8 @@ def create_mock_ctx(yaml_content=""):
             False,
             None,
             None,
-            ["name: test-connector", 'version: "1.0.0"', "source:"],
-            [],
+            ("name: test-connector", 'version: "1.0.0"', "source:"),
+            (),
             None,
             id="basic_read",
         ),
@@ -57,8 +96,8 @@ def create_mock_ctx(yaml_content=""):
             True,
             None,
             None,
-            ["   1 |", "name: test-connector"],
-            [],
+            ("   1 |", "name: test-connector"),
+            (),
             None,
             id="with_line_numbers",
         ),
@@ -67,8 +106,8 @@ def create_mock_ctx(yaml_content=""):
             False,
             5,
             10,
-            ["line 5", "line 10"],
-            [],
+            ("line 5", "line 10"),
+            (),
             6,
             id="line_range",
         ),
@@ -77,8 +116,8 @@ def create_mock_ctx(yaml_content=""):
             False,
             15,
             None,
-            ["line 15", "line 20"],
-            [],
+            ("line 15", "line 20"),
+            (),
             None,
             id="start_line_only",
         ),
@@ -87,8 +126,8 @@ def create_mock_ctx(yaml_content=""):
             False,
             None,
             5,
-            ["line 1", "line 5"],
-            [],
+            ("line 1", "line 5"),
+            (),
             5,
             id="end_line_only",
         ),
@@ -97,8 +136,8 @@ def create_mock_ctx(yaml_content=""):
             True,
             5,
             8,
-            ["   5 |", "   8 |"],
-            ["   4 |", "   9 |"],
+            ("   5 |", "   8 |"),
+            ("   4 |", "   9 |"),
             None,
             id="line_numbers_with_range",
         ),
@@ -107,8 +146,8 @@ def create_mock_ctx(yaml_content=""):
             False,
             None,
             None,
-            ["Error: No YAML content available"],
-            [],
+            NO_CONTENT_ERROR,
+            (),
             None,
             id="no_content",
         ),
@@ -117,8 +156,8 @@ def create_mock_ctx(yaml_content=""):
             False,
             100,
             None,
-            ["Error: start_line", "out of range"],
-            [],
+            START_LINE_RANGE_ERROR,
+            (),
             None,
             id="invalid_start_line",
         ),
@@ -127,14 +166,25 @@ def create_mock_ctx(yaml_content=""):
             False,
             5,
             3,
-            ["Error: end_line"],
-            [],
+            ("Error: end_line",),
+            (),
             None,
             id="invalid_end_line",
         ),
+        pytest.param(
+            MULTILINE_YAML,
+            False,
+            15,
+            21,
+            ("Error: end_line 21 is out of range", "20 lines"),
+            (),
+            None,
+            id="end_line_out_of_range",
+        ),
     ],
 )
 def test_get_manifest_text(
+    make_ctx,
     yaml_content,
     with_line_numbers,
     start_line,
@@ -144,14 +194,14 @@ def test_get_manifest_text(
     expected_line_count,
 ):
     """Test get_manifest_text with various parameters and edge cases."""
-    ctx = create_mock_ctx(yaml_content)
+    ctx = make_ctx(yaml_content)
     result = get_manifest_text(ctx, with_line_numbers, start_line, end_line)
 
-    for expected in expected_in_result:
-        assert expected in result
+    missing = [s for s in expected_in_result if s not in result]
+    assert not missing, f"missing {missing} in {result!r}"
 
-    for not_expected in expected_not_in_result:
-        assert not_expected not in result
+    unexpected = [s for s in expected_not_in_result if s in result]
+    assert not unexpected, f"unexpected {unexpected} in {result!r}"
 
     if expected_line_count is not None:
         assert len(result.split("\n")) == expected_line_count
@@ -164,7 +214,7 @@ def test_get_manifest_text(
             SAMPLE_YAML,
             1,
             "# New header comment",
-            ["Successfully inserted", "1 line(s)"],
+            ("Successfully inserted", "1 line(s)"),
             {0: "# New header comment", 1: "name: test-connector"},
             True,
             id="insert_at_beginning",
@@ -173,7 +223,7 @@ def test_get_manifest_text(
             MULTILINE_YAML,
             10,
             "inserted line",
-            ["Successfully inserted"],
+            ("Successfully inserted",),
             {9: "inserted line", 10: "line 10"},
             True,
             id="insert_in_middle",
@@ -182,7 +232,7 @@ def test_get_manifest_text(
             MULTILINE_YAML,
             100,
             "# End comment",
-            ["Successfully inserted"],
+            ("Successfully inserted",),
             {},
             True,
             id="insert_at_end",
@@ -191,7 +241,7 @@ def test_get_manifest_text(
             SAMPLE_YAML,
             1,
             "# Comment 1\n# Comment 2\n# Comment 3",
-            ["Successfully inserted", "3 line(s)"],
+            ("Successfully inserted", "3 line(s)"),
             {
                 0: "# Comment 1",
                 1: "# Comment 2",
@@ -201,11 +251,20 @@ def test_get_manifest_text(
             True,
             id="insert_multiline",
         ),
+        pytest.param(
+            SAMPLE_YAML,
+            1,
+            "",
+            ("Successfully inserted", "0 line(s)"),
+            {},
+            False,
+            id="insert_nothing",
+        ),
         pytest.param(
             SAMPLE_YAML,
             0,
             "content",
-            ["Error: line_number must be >= 1"],
+            ("Error: line_number must be >= 1",),
             {},
             False,
             id="invalid_line_number",
@@ -214,7 +273,7 @@ def test_get_manifest_text(
             "",
             1,
             "content",
-            ["Error: No YAML content available"],
+            NO_CONTENT_ERROR,
             {},
             False,
             id="no_content",
@@ -222,6 +281,7 @@ def test_get_manifest_text(
     ],
 )
 def test_insert_manifest_lines(
+    make_ctx,
     yaml_content,
     line_number,
     lines_to_insert,
@@ -230,20 +290,18 @@ def test_insert_manifest_lines(
     should_modify,
 ):
     """Test insert_manifest_lines with various parameters and edge cases."""
-    ctx = create_mock_ctx(yaml_content)
+    ctx = make_ctx(yaml_content)
     original_content = yaml_content
     result = insert_manifest_lines(ctx, line_number, lines_to_insert)
 
-    for expected in expected_in_result:
-        assert expected in result
-
-    if should_modify:
-        assert ctx.deps.yaml_content != original_content
-        lines = ctx.deps.yaml_content.split("\n")
-        for line_idx, expected_text in expected_at_line.items():
-            assert expected_text in lines[line_idx]
-    else:
-        assert ctx.deps.yaml_content == original_content
+    _assert_edit_outcome(
+        ctx,
+        original_content,
+        result,
+        expected_in_result,
+        expected_at_line,
+        should_modify,
+    )
 
 
 @pytest.mark.parametrize(
@@ -254,7 +312,7 @@ def test_insert_manifest_lines(
             5,
             5,
             "replaced line 5",
-            ["Successfully replaced", "1 line(s)"],
+            ("Successfully replaced", "1 line(s)"),
             {3: "line 4", 4: "replaced line 5", 5: "line 6"},
             True,
             id="replace_single_line",
@@ -264,7 +322,7 @@ def test_insert_manifest_lines(
             5,
             8,
             "replacement line 1\nreplacement line 2",
-            ["Successfully replaced", "4 line(s)", "2 new line(s)"],
+            ("Successfully replaced", "4 line(s)", "2 new line(s)"),
             {4: "replacement line 1", 5: "replacement line 2", 6: "line 9"},
             True,
             id="replace_multiple_lines",
@@ -274,7 +332,7 @@ def test_insert_manifest_lines(
             1,
             2,
             "# New header",
-            ["Successfully replaced"],
+            ("Successfully replaced",),
             {0: "# New header", 1: 'description: "A test connector"'},
             True,
             id="replace_at_beginning",
@@ -284,7 +342,7 @@ def test_insert_manifest_lines(
             19,
             20,
             "# End lines replaced",
-            ["Successfully replaced"],
+            ("Successfully replaced",),
             {},
             True,
             id="replace_at_end",
@@ -294,7 +352,7 @@ def test_insert_manifest_lines(
             10,
             15,
             "",
-            ["Successfully replaced"],
+            ("Successfully replaced",),
             {9: "line 16"},
             True,
             id="replace_with_empty_string",
@@ -304,7 +362,7 @@ def test_insert_manifest_lines(
             100,
             101,
             "content",
-            ["Error: start_line", "out of range"],
+            START_LINE_RANGE_ERROR,
             {},
             False,
             id="invalid_start_line",
@@ -314,7 +372,7 @@ def test_insert_manifest_lines(
             5,
             3,
             "content",
-            ["Error: end_line", "before start_line"],
+            ("Error: end_line", "before start_line"),
             {},
             False,
             id="end_before_start",
@@ -324,7 +382,7 @@ def test_insert_manifest_lines(
             1,
             100,
             "content",
-            ["Error: end_line", "out of range"],
+            ("Error: end_line", "out of range"),
             {},
             False,
             id="invalid_end_line",
@@ -334,7 +392,7 @@ def test_insert_manifest_lines(
             1,
             2,
             "content",
-            ["Error: No YAML content available"],
+            NO_CONTENT_ERROR,
             {},
             False,
             id="no_content",
@@ -342,6 +400,7 @@ def test_insert_manifest_lines(
     ],
 )
 def test_replace_manifest_lines(
+    make_ctx,
     yaml_content,
     start_line,
     end_line,
@@ -351,17 +410,78 @@ def test_replace_manifest_lines(
     should_modify,
 ):
     """Test replace_manifest_lines with various parameters and edge cases."""
-    ctx = create_mock_ctx(yaml_content)
+    ctx = make_ctx(yaml_content)
     original_content = yaml_content
     result = replace_manifest_lines(ctx, start_line, end_line, new_lines)
 
-    for expected in expected_in_result:
-        assert expected in result
+    _assert_edit_outcome(
+        ctx,
+        original_content,
+        result,
+        expected_in_result,
+        expected_at_line,
+        should_modify,
+    )
 
-    if should_modify:
-        assert ctx.deps.yaml_content != original_content
-        lines = ctx.deps.yaml_content.split("\n")
-        for line_idx, expected_text in expected_at_line.items():
-            assert expected_text in lines[line_idx]
-    else:
-        assert ctx.deps.yaml_content == original_content
+
+def test_manifest_edits_preserve_trailing_newline(make_ctx):
+    """Test that inserting and replacing lines keeps the manifest's final newline."""
+    ctx = make_ctx(SAMPLE_YAML)
+
+    insert_manifest_lines(ctx, 100, "# End comment")
+    assert ctx.deps.yaml_content == SAMPLE_YAML + "# End comment\n"
+
+    replace_manifest_lines(ctx, 1, 1, "name: renamed-connector")
+    assert ctx.deps.yaml_content.startswith("name: renamed-connector\nversion:")
+    assert ctx.deps.yaml_content.endswith("# End comment\n")
+
+
+def test_get_manifest_text_reflects_edits_after_read(make_ctx):
+    """Test that reading, editing, then reading again returns the edited lines."""
+    ctx = make_ctx(MULTILINE_YAML)
+
+    assert get_manifest_text(ctx, False, 5, 5) == "line 5"
+
+    replace_manifest_lines(ctx, 5, 5, "replaced line 5")
+    assert get_manifest_text(ctx, False, 5, 5) == "replaced line 5"
+
+    insert_manifest_lines(ctx, 1, "# header")
+    assert get_manifest_text(ctx, False, 1, 1) == "# header"
+    assert get_manifest_text(ctx, False, 6, 6) == "replaced line 5"
+
+
+def test_manifest_edits_on_large_manifest(make_ctx):
+    """Test that edits deep into a 100k-line manifest splice only the target lines."""
+    ctx = make_ctx(LARGE_MULTILINE_YAML)
+
+    insert_manifest_lines(ctx, 50_000, "inserted line")
+    replace_manifest_lines(ctx, 90_001, 90_002, "replaced line")
+
+    assert get_manifest_text(ctx, False, 49_999, 50_001) == (
+        "line 49999\ninserted line\nline 50000"
+    )
+    assert get_manifest_text(ctx, False, 90_000, 90_002) == (
+        "line 89999\nreplaced line\nline 90002"
+    )
+    assert len(ctx.deps.manifest_lines()) == 100_000
+
+
+def test_manifest_lines_only_break_on_newline(make_ctx):
+    """Test that a carriage return does not add a line the edit tools cannot address."""
+    ctx = make_ctx("a: 1\rb: 2\nc: 3\n")
+
+    assert get_manifest_text(ctx, True) == "   1 | a: 1\rb: 2\n   2 | c: 3"
+
+    result = replace_manifest_lines(ctx, 2, 2, "c: 4")
+    assert "Successfully replaced" in result
+    assert ctx.deps.yaml_content == "a: 1\rb: 2\nc: 4\n"
+
+
+def test_manifest_line_numbers_match_edits_with_form_feed(make_ctx):
+    """Test that the line the reader shows as line 3 is the line an edit replaces."""
+    ctx = make_ctx("a: 1\nb: 'x\x0cy'\nc: 3")
+
+    assert get_manifest_text(ctx, False, 3, 3) == "c: 3"
+
+    replace_manifest_lines(ctx, 3, 3, "c: 4")
+    assert ctx.deps.yaml_content == "a: 1\nb: 'x\x0cy'\nc: 4"